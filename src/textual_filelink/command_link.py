@@ -2,21 +2,40 @@
 
 from __future__ import annotations
 
+import functools
+import itertools
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Callable, Optional, Union
 
+from rich.cells import cell_len
+from textual import events
+from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal
 from textual.message import Message
+from textual.timer import Timer
 from textual.widgets import Static
 
 from .file_link import FileLink
 from .logging import get_logger
-from .utils import format_keyboard_shortcuts, sanitize_id
+from .utils import absolute_path, format_keyboard_shortcuts, sanitize_id
 
 _logger = get_logger()
 
 
+@functools.cache
+def _format_shortcuts(keys: tuple[str, ...]) -> str:
+    """Memoized format_keyboard_shortcuts(), keyed by an immutable tuple of keys."""
+    return format_keyboard_shortcuts(list(keys))
+
+
+@functools.cache
+def _default_tooltip(label: str, hint: str) -> str:
+    """Memoized default control tooltip, e.g. "Run command (space/p)"."""
+    return f"{label} {hint}"
+
+
 class CommandLink(Horizontal, can_focus=True):
     """Command orchestration widget with status, play/stop, optional timer, and settings.
 
@@ -129,6 +148,8 @@ class CommandLink(Horizontal, can_focus=True):
             Output file path if set.
         """
 
+        __slots__ = ("widget", "name", "output_path")
+
         def __init__(self, widget: CommandLink, name: str, output_path: Optional[Path]) -> None:
             super().__init__()
             self.widget = widget
@@ -148,6 +169,8 @@ class CommandLink(Horizontal, can_focus=True):
             Output file path if set.
         """
 
+        __slots__ = ("widget", "name", "output_path")
+
         def __init__(self, widget: CommandLink, name: str, output_path: Optional[Path]) -> None:
             super().__init__()
             self.widget = widget
@@ -167,6 +190,8 @@ class CommandLink(Horizontal, can_focus=True):
             Output file path if set.
         """
 
+        __slots__ = ("widget", "name", "output_path")
+
         def __init__(self, widget: CommandLink, name: str, output_path: Optional[Path]) -> None:
             super().__init__()
             self.widget = widget
@@ -182,6 +207,8 @@ class CommandLink(Horizontal, can_focus=True):
             Output file path.
         """
 
+        __slots__ = ("output_path",)
+
         def __init__(self, output_path: Path) -> None:
             super().__init__()
             self.output_path = output_path
@@ -191,6 +218,15 @@ class CommandLink(Horizontal, can_focus=True):
     DEFAULT_PLAY_STOP_KEYS = ["space", "p"]
     DEFAULT_SETTINGS_KEYS = ["s"]
 
+    # Shortcut strings shared by every CommandLink with the same shortcut shape:
+    # (has output, open keys, play/stop keys, has settings, settings keys)
+    _shortcuts_string_cache: dict[tuple[object, ...], str] = {}
+
+    # Running spinners grouped by (app, interval); each group is animated by one
+    # shared timer instead of a timer per widget
+    _spinner_groups: dict[tuple[App, float], set[CommandLink]] = {}
+    _spinner_timers: dict[tuple[App, float], Timer] = {}
+
     def __init__(
         self,
         command_name: str,
@@ -267,10 +303,9 @@ class CommandLink(Horizontal, can_focus=True):
             CSS classes.
         """
         self._command_name = command_name
-        self._output_path = Path(output_path).resolve() if output_path else None
+        self._output_path = absolute_path(output_path) if output_path else None
         self._command_builder = command_builder
         self._command_template = command_template
-        self._show_settings = show_settings
         self._show_timer = show_timer
         self._timer_field_width = timer_field_width
         self._custom_tooltip = tooltip  # Use _custom_tooltip to avoid conflict with Textual's _tooltip
@@ -280,9 +315,17 @@ class CommandLink(Horizontal, can_focus=True):
         self._custom_play_stop_keys = play_stop_keys
         self._custom_settings_keys = settings_keys
 
+        # Formatted key hints, e.g. "(space/p)"; keys are fixed after init, so format once
+        self._play_stop_hint = _format_shortcuts(tuple(play_stop_keys or self.DEFAULT_PLAY_STOP_KEYS))
+        self._settings_hint = _format_shortcuts(tuple(settings_keys or self.DEFAULT_SETTINGS_KEYS))
+        # Default control tooltips; memoized, so links with the same keys share one string each
+        self._default_run_tooltip = _default_tooltip("Run command", self._play_stop_hint)
+        self._default_stop_tooltip = _default_tooltip("Stop command", self._play_stop_hint)
+        self._default_settings_tooltip = _default_tooltip("Settings", self._settings_hint)
+
         # Status state
         self._status_icon = initial_status_icon
-        self._status_tooltip = initial_status_tooltip
+        self._status_tooltip: Optional[str] = initial_status_tooltip
         self._command_running = False
 
         # Custom tooltips for play/stop button (will be used if set)
@@ -291,15 +334,19 @@ class CommandLink(Horizontal, can_focus=True):
         self._custom_settings_tooltip: Optional[str] = None
 
         # Spinner configuration and state
-        self._spinner_frames = spinner_frames if spinner_frames is not None else self.DEFAULT_SPINNER_FRAMES
+        self._spinner_frames: list[str] = spinner_frames if spinner_frames is not None else self.DEFAULT_SPINNER_FRAMES
         self._spinner_interval = spinner_interval
-        self._spinner_frame_index = 0
-        self._spinner_timer = None
+        self._spinner_cycle: Iterator[str] = itertools.cycle(self._spinner_frames)
+        self._spinner_key: Optional[tuple[App, float]] = None
+        # Frames of equal cell width can't resize the status widget, so ticks after
+        # the first only need a repaint, not a layout pass
+        self._spinner_uniform_width = len({cell_len(frame) for frame in self._spinner_frames}) <= 1
+        self._spinner_needs_layout = True
 
         # Timer state for elapsed/time-ago display
         self._start_time: Optional[float] = start_time
         self._end_time: Optional[float] = end_time
-        self._timer_update_interval = None
+        self._timer_update_interval: Optional[Timer] = None
         self._last_timer_display: str = ""  # Track last displayed timer to avoid unnecessary refreshes
 
         # Auto-generate ID if not provided
@@ -312,7 +359,27 @@ class CommandLink(Horizontal, can_focus=True):
             classes=classes,
         )
 
-        # Create child widgets
+        # Status, timer, play/stop and name widgets are created in compose(), so links
+        # that are built but never mounted don't allocate them. Until then, setters
+        # only record state, which compose() applies.
+        self._children_built = False
+        self._status_widget: Static
+        self._timer_widget: Static
+        self._play_stop_widget: Static
+        self._name_widget: Union[FileLink, Static]
+        self._name_tooltip = ""
+
+        # Settings icon (optional; None when show_settings=False)
+        self._settings_widget: Optional[Static] = None
+        if show_settings:
+            self._settings_widget = Static("⚙️", classes="settings-icon")
+            self._settings_widget.tooltip = self._custom_settings_tooltip or self._default_settings_tooltip
+
+        # Set tooltip on name widget with available keyboard shortcuts
+        self._build_tooltip_with_shortcuts()
+
+    def compose(self) -> ComposeResult:
+        """Create child widgets from the current state and compose widget layout."""
         self._status_widget = Static(self._status_icon, classes="status-icon")
         if self._status_tooltip:
             self._status_widget.tooltip = self._status_tooltip
@@ -320,97 +387,78 @@ class CommandLink(Horizontal, can_focus=True):
         # Timer widget (only created if show_timer is True)
         if self._show_timer:
             self._timer_widget = Static("", classes="timer-display")
-            # Initial render of timer (empty or with current data)
-            self._update_timer_display()
+            self._last_timer_display = ""
 
-        # Play/stop button
-        self._play_stop_widget = Static("▶️", classes="play-stop-button")
-        self._play_stop_widget.tooltip = self._custom_run_tooltip or "Run command (space/p)"
-        self._play_stop_widget._is_play_button = True  # type: ignore
+        self._play_stop_widget = Static("", classes="play-stop-button")
+        self._name_widget = self._create_name_widget()
+        self._children_built = True
 
-        # Name (FileLink if output_path, Static otherwise)
-        self._name_widget: Union[FileLink, Static]
-        if self._output_path:
-            self._name_widget = FileLink(
-                self._output_path,
-                display_name=self._command_name,
-                command_builder=self._command_builder,
-                command_template=self._command_template,
-                _embedded=True,
-            )
-        else:
-            self._name_widget = Static(self._command_name, classes="command-name")
+        self._update_play_stop_widget()
+        self._name_widget.tooltip = self._name_tooltip
+        # Initial render of timer (empty or with current data)
+        self._update_timer_display()
 
-        # Set tooltip on name widget with available keyboard shortcuts
-        self._build_tooltip_with_shortcuts()
-
-        # Settings icon (optional)
-        if self._show_settings:
-            self._settings_widget = Static("⚙️", classes="settings-icon")
-            self._settings_widget.tooltip = self._custom_settings_tooltip or "Settings (s)"
-
-    def compose(self):
-        """Compose widget layout."""
         yield self._status_widget
         if self._show_timer:
             yield self._timer_widget
         yield self._play_stop_widget
         yield self._name_widget
-        if self._show_settings:
+        if self._settings_widget is not None:
             yield self._settings_widget
 
     def on_mount(self) -> None:
-        """Set up runtime keyboard bindings and timer interval."""
+        """Set up custom keyboard bindings and timer interval."""
         _logger.debug(f"Mounting CommandLink: {self._command_name}")
 
-        # Open output bindings (only if output_path is set)
-        if self._output_path:
-            open_keys = self._custom_open_keys if self._custom_open_keys is not None else self.DEFAULT_OPEN_KEYS
-            for key in open_keys:
-                self._bindings.bind(key, "open_output", "Open output", show=False)
+        # Default keys come from the class-level BINDINGS (the actions ignore them
+        # when there's no output path or settings icon); only custom keys are bound here.
 
-        # Play/stop bindings
-        play_stop_keys = (
-            self._custom_play_stop_keys if self._custom_play_stop_keys is not None else self.DEFAULT_PLAY_STOP_KEYS
-        )
-        for key in play_stop_keys:
-            self._bindings.bind(key, "play_stop", "Play/Stop", show=False)
+        # Custom open output bindings (only if output_path is set)
+        if self._output_path and self._custom_open_keys is not None:
+            self._bind_keys(self._custom_open_keys, "open_output", "Open output")
 
-        # Settings bindings (if enabled)
-        if self._show_settings:
-            settings_keys = (
-                self._custom_settings_keys if self._custom_settings_keys is not None else self.DEFAULT_SETTINGS_KEYS
-            )
-            for key in settings_keys:
-                self._bindings.bind(key, "settings", "Settings", show=False)
+        # Custom play/stop bindings
+        if self._custom_play_stop_keys is not None:
+            self._bind_keys(self._custom_play_stop_keys, "play_stop", "Play/Stop")
+
+        # Custom settings bindings (if enabled)
+        if self._settings_widget is not None and self._custom_settings_keys is not None:
+            self._bind_keys(self._custom_settings_keys, "settings", "Settings")
 
         # Timer update interval (if enabled)
         if self._show_timer:
             self._timer_update_interval = self.set_interval(1.0, self._update_timer_display)
             _logger.debug(f"Timer started: start={self._start_time}, end={self._end_time}")
 
+        # Spinner requested before mount
+        if self._command_running:
+            self._start_spinner()
+
     def on_unmount(self) -> None:
         """Clean up timer interval when widget is unmounted."""
         _logger.debug(f"Unmounting CommandLink: {self._command_name}")
 
+        # Leave the shared spinner group
+        self._stop_spinner()
+
         # Stop timer update interval if running
         if self._timer_update_interval:
             self._timer_update_interval.stop()
             self._timer_update_interval = None
 
-    def on_click(self, event) -> None:
+    def on_click(self, event: events.Click) -> None:
         """Handle clicks on child widgets."""
         event.stop()
 
         # Play/stop button
-        if hasattr(event.widget, "_is_play_button"):
+        if event.widget is self._play_stop_widget:
             if self._command_running:
                 self.post_message(self.StopClicked(self, self._command_name, self._output_path))
             else:
                 self.post_message(self.PlayClicked(self, self._command_name, self._output_path))
 
         # Settings icon
-        elif event.widget == self._settings_widget if self._show_settings else False:
+        elif self._settings_widget is not None and event.widget is self._settings_widget:
             self.post_message(self.SettingsClicked(self, self._command_name, self._output_path))
 
     def on_file_link_opened(self, event: FileLink.Opened) -> None:
@@ -424,7 +472,8 @@ class CommandLink(Horizontal, can_focus=True):
     # ------------------------------------------------------------------ #
     def action_open_output(self) -> None:
         """Open output file (if set)."""
-        if self._output_path and isinstance(self._name_widget, FileLink):
+        # Before compose() there is no name widget to open from
+        if self._output_path and self._children_built and isinstance(self._name_widget, FileLink):
             self._name_widget.action_open_file()
 
     def action_play_stop(self) -> None:
@@ -436,12 +485,23 @@ class CommandLink(Horizontal, can_focus=True):
 
     def action_settings(self) -> None:
         """Open settings."""
-        if self._show_settings:
+        if self._settings_widget is not None:
             self.post_message(self.SettingsClicked(self, self._command_name, self._output_path))
 
     # ------------------------------------------------------------------ #
     # Helper methods
     # ------------------------------------------------------------------ #
+    def _bind_keys(self, keys: list[str], action: str, description: str) -> None:
+        """Bind keys to an action on this instance only.
+
+        A widget's BindingsMap is a shallow copy of the class bindings, so the
+        per-key lists are copied before appending to keep other instances untouched.
+        """
+        key_to_bindings = self._bindings.key_to_bindings
+        for key in keys:
+            key_to_bindings[key] = list(key_to_bindings.get(key, ()))
+            self._bindings.bind(key, action, description, show=False)
+
     def _build_tooltip_with_shortcuts(self) -> None:
         """Build and set tooltip on name widget showing description with keyboard shortcuts."""
         shortcuts_str = self._get_shortcuts_string()
@@ -450,7 +510,36 @@ class CommandLink(Horizontal, can_focus=True):
         base = self._custom_tooltip if self._custom_tooltip else self._command_name
         tooltip = f"{base} - {shortcuts_str}" if shortcuts_str else base
 
-        self._name_widget.tooltip = tooltip
+        self._set_name_widget_tooltip(tooltip)
+
+    def _set_name_widget_tooltip(self, tooltip: str) -> None:
+        """Record the name tooltip and apply it once the name widget exists."""
+        self._name_tooltip = tooltip
+        if self._children_built:
+            self._name_widget.tooltip = tooltip
+
+    def _create_name_widget(self) -> Union[FileLink, Static]:
+        """Create the name widget: FileLink if output_path is set, Static otherwise."""
+        if self._output_path:
+            return FileLink(
+                self._output_path,
+                display_name=self._command_name,
+                command_builder=self._command_builder,
+                command_template=self._command_template,
+                _embedded=True,
+            )
+        return Static(self._command_name, classes="command-name")
+
+    def _update_play_stop_widget(self) -> None:
+        """Show the play or stop icon and tooltip matching the running state."""
+        if not self._children_built:
+            return
+        if self._command_running:
+            self._play_stop_widget.update("⏹️")
+            self._play_stop_widget.tooltip = self._custom_stop_tooltip or self._default_stop_tooltip
+        else:
+            self._play_stop_widget.update("▶️")
+            self._play_stop_widget.tooltip = self._custom_run_tooltip or self._default_run_tooltip
 
     def _get_shortcuts_string(self) -> str:
         """Get keyboard shortcuts as a formatted string.
@@ -460,23 +549,33 @@ class CommandLink(Horizontal, can_focus=True):
         str
             Comma-separated shortcuts, e.g., "Play/Stop (space/p), Settings (s)"
         """
+        has_output = self._output_path is not None
+        has_settings = self._settings_widget is not None
+        open_keys = tuple(self._custom_open_keys or self.DEFAULT_OPEN_KEYS) if has_output else ()
+        play_stop_keys = tuple(self._custom_play_stop_keys or self.DEFAULT_PLAY_STOP_KEYS)
+        settings_keys = tuple(self._custom_settings_keys or self.DEFAULT_SETTINGS_KEYS) if has_settings else ()
+
+        cache_key = (has_output, open_keys, play_stop_keys, has_settings, settings_keys)
+        cached = self._shortcuts_string_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         shortcuts = []
 
         # Add output opening if available
-        if self._output_path:
-            open_keys = self._custom_open_keys or self.DEFAULT_OPEN_KEYS
-            shortcuts.append(f"Open output {format_keyboard_shortcuts(open_keys)}")
+        if has_output:
+            shortcuts.append(f"Open output {_format_shortcuts(open_keys)}")
 
         # Add play/stop
-        play_stop_keys = self._custom_play_stop_keys or self.DEFAULT_PLAY_STOP_KEYS
-        shortcuts.append(f"Play/Stop {format_keyboard_shortcuts(play_stop_keys)}")
+        shortcuts.append(f"Play/Stop {_format_shortcuts(play_stop_keys)}")
 
         # Add settings if available
-        if self._show_settings:
-            settings_keys = self._custom_settings_keys or self.DEFAULT_SETTINGS_KEYS
-            shortcuts.append(f"Settings {format_keyboard_shortcuts(settings_keys)}")
+        if has_settings:
+            shortcuts.append(f"Settings {_format_shortcuts(settings_keys)}")
 
-        return ", ".join(shortcuts)
+        shortcuts_str = ", ".join(shortcuts)
+        self._shortcuts_string_cache[cache_key] = shortcuts_str
+        return shortcuts_str
 
     # ------------------------------------------------------------------ #
     # Public API
@@ -547,16 +646,21 @@ class CommandLink(Horizontal, can_focus=True):
         """
         _logger.debug(f"Status: {self._command_name} → icon={icon}, running={running}")
 
-        # Update status icon
-        if icon is not None:
+        # Update status icon (skipped if unchanged, so repeated status polls don't re-render)
+        if icon is not None and icon != self._status_icon:
             self._status_icon = icon
             # Update widget display (spinner will override if running)
-            self._status_widget.update(icon)
+            if self._children_built:
+                self._status_widget.update(icon)
+                if self._command_running:
+                    # The icon may differ in width from the spinner frames; re-layout on the next tick
+                    self._spinner_needs_layout = True
 
         # Update status tooltip
-        if tooltip is not None:
+        if tooltip is not None and tooltip != self._status_tooltip:
             self._status_tooltip = tooltip
-            self._status_widget.tooltip = tooltip
+            if self._children_built:
+                self._status_widget.tooltip = tooltip
 
         # Update name tooltip if provided
         if name_tooltip is not None:
@@ -576,24 +680,20 @@ class CommandLink(Horizontal, can_focus=True):
             self._command_running = running
 
             # Update play/stop button
-            if running:
-                self._play_stop_widget.update("⏹️")
-                self._play_stop_widget.tooltip = self._custom_stop_tooltip or "Stop command (space/p)"
-            else:
-                self._play_stop_widget.update("▶️")
-                self._play_stop_widget.tooltip = self._custom_run_tooltip or "Run command (space/p)"
+            self._update_play_stop_widget()
 
             # Manage spinner
             if running and not was_running:
                 # Start spinner
-                self._spinner_frame_index = 0
-                self._spinner_timer = self.set_interval(self._spinner_interval, self._animate_spinner)
+                self._spinner_cycle = itertools.cycle(self._spinner_frames)
+                self._spinner_needs_layout = True
+                if self.is_mounted:
+                    self._start_spinner()
             elif not running and was_running:
                 # Stop spinner, show final icon
-                if self._spinner_timer:
-                    self._spinner_timer.stop()
-                    self._spinner_timer = None
-                self._status_widget.update(self._status_icon)
+                self._stop_spinner()
+                if self._children_built:
+                    self._status_widget.update(self._status_icon)
 
             # Update timer display when running state changes
             self._update_timer_display()
@@ -657,44 +757,30 @@ class CommandLink(Horizontal, can_focus=True):
         ----------
         output_path : Union[Path, str, None]
             New output path. If None, removes output path.
+            Setting the current path again is a no-op.
         """
-        self._output_path = Path(output_path).resolve() if output_path else None
+        # Cheap check first: callers often pass back the already-absolute path
+        if output_path == self._output_path:
+            return
+        new_path = absolute_path(output_path) if output_path else None
+        if new_path == self._output_path:
+            return
+        self._output_path = new_path
 
-        # Handle state transitions
-        if self._output_path:
-            # Need FileLink widget
-            if isinstance(self._name_widget, FileLink):
+        # Handle state transitions (before compose, the right widget is created there)
+        if self._children_built:
+            if self._output_path and isinstance(self._name_widget, FileLink):
                 # Update existing FileLink's path
                 self._name_widget.set_path(
                     self._output_path,
                     display_name=self._command_name,
                 )
-            else:
-                # Replace Static with FileLink
+            elif bool(self._output_path) != isinstance(self._name_widget, FileLink):
+                # Swap Static <-> FileLink
                 self._name_widget.remove()
-                self._name_widget = FileLink(
-                    self._output_path,
-                    display_name=self._command_name,
-                    command_builder=self._command_builder,
-                    command_template=self._command_template,
-                    _embedded=True,
-                )
+                self._name_widget = self._create_name_widget()
                 # Mount before settings widget if it exists, otherwise at end
-                if self._show_settings:
-                    self.mount(self._name_widget, before=self._settings_widget)
-                else:
-                    self.mount(self._name_widget)
-        else:
-            # Need Static widget (no output path)
-            if isinstance(self._name_widget, FileLink):
-                # Replace FileLink with Static
-                self._name_widget.remove()
-                self._name_widget = Static(self._command_name, classes="command-name")
-                # Mount before settings widget if it exists, otherwise at end
-                if self._show_settings:
-                    self.mount(self._name_widget, before=self._settings_widget)
-                else:
-                    self.mount(self._name_widget)
+                self.mount(self._name_widget, before=self._settings_widget)
 
         # Update tooltip to reflect new output path availability
         self._build_tooltip_with_shortcuts()
@@ -721,7 +807,7 @@ class CommandLink(Horizontal, can_focus=True):
         else:
             # Set tooltip directly without shortcuts
             base = self._custom_tooltip if self._custom_tooltip else self._command_name
-            self._name_widget.tooltip = base
+            self._set_name_widget_tooltip(base)
 
     def set_play_stop_tooltips(
         self,
@@ -756,9 +842,7 @@ class CommandLink(Horizontal, can_focus=True):
         ...     append_shortcuts=False
         ... )  # Shows "Start build" and "Cancel build"
         """
-        # Get the play/stop keys for formatting
-        play_stop_keys = self._custom_play_stop_keys or self.DEFAULT_PLAY_STOP_KEYS
-        shortcuts_str = format_keyboard_shortcuts(play_stop_keys) if append_shortcuts else ""
+        shortcuts_str = self._play_stop_hint if append_shortcuts else ""
 
         if run_tooltip is not None:
             if append_shortcuts and shortcuts_str:
@@ -773,10 +857,7 @@ class CommandLink(Horizontal, can_focus=True):
                 self._custom_stop_tooltip = stop_tooltip
 
         # Update current tooltip based on running state
-        if self._command_running:
-            self._play_stop_widget.tooltip = self._custom_stop_tooltip or "Stop command (space/p)"
-        else:
-            self._play_stop_widget.tooltip = self._custom_run_tooltip or "Run command (space/p)"
+        self._update_play_stop_widget()
 
     def set_settings_tooltip(self, tooltip: Optional[str], append_shortcuts: bool = True) -> None:
         """Set custom tooltip for settings icon.
@@ -784,7 +865,7 @@ class CommandLink(Horizontal, can_focus=True):
         Parameters
         ----------
         tooltip : Optional[str]
-            Custom tooltip text. If None, uses default "Settings (s)".
+            Custom tooltip text. If None, uses default "Settings (s)" (with the configured keys).
         append_shortcuts : bool
             Whether to automatically append keyboard shortcuts to the tooltip.
             Default is True.
@@ -795,8 +876,7 @@ class CommandLink(Horizontal, can_focus=True):
         >>> link.set_settings_tooltip("Build options", append_shortcuts=False)  # Shows "Build options"
         """
         if tooltip is not None:
-            settings_keys = self._custom_settings_keys or self.DEFAULT_SETTINGS_KEYS
-            shortcuts_str = format_keyboard_shortcuts(settings_keys) if append_shortcuts else ""
+            shortcuts_str = self._settings_hint if append_shortcuts else ""
 
             if append_shortcuts and shortcuts_str:
                 self._custom_settings_tooltip = f"{tooltip} {shortcuts_str}"
@@ -805,15 +885,43 @@ class CommandLink(Horizontal, can_focus=True):
         else:
             self._custom_settings_tooltip = None
 
-        if self._show_settings:
-            self._settings_widget.tooltip = self._custom_settings_tooltip or "Settings (s)"
+        if self._settings_widget is not None:
+            self._settings_widget.tooltip = self._custom_settings_tooltip or self._default_settings_tooltip
+
+    def _start_spinner(self) -> None:
+        """Join the shared spinner group for this app and interval, starting its timer if needed."""
+        key = (self.app, self._spinner_interval)
+        self._spinner_groups.setdefault(key, set()).add(self)
+        if key not in self._spinner_timers:
+            self._spinner_timers[key] = self.app.set_interval(
+                self._spinner_interval, functools.partial(CommandLink._tick_spinners, key)
+            )
+        self._spinner_key = key
+
+    def _stop_spinner(self) -> None:
+        """Leave the shared spinner group, stopping its timer when the group empties."""
+        key = self._spinner_key
+        if key is None:
+            return
+        self._spinner_key = None
+        group = self._spinner_groups.get(key)
+        if group is not None:
+            group.discard(self)
+            if not group:
+                del self._spinner_groups[key]
+                self._spinner_timers.pop(key).stop()
+
+    @classmethod
+    def _tick_spinners(cls, key: tuple[App, float]) -> None:
+        """Advance every spinner in a group (called by the group's shared timer)."""
+        for link in list(cls._spinner_groups.get(key, ())):
+            link._animate_spinner()
 
     def _animate_spinner(self) -> None:
         """Animate the spinner (called by timer)."""
         if self._command_running:
-            frame = self._spinner_frames[self._spinner_frame_index]
-            self._status_widget.update(frame)
-            self._spinner_frame_index = (self._spinner_frame_index + 1) % len(self._spinner_frames)
+            self._status_widget.update(next(self._spinner_cycle), layout=self._spinner_needs_layout)
+            self._spinner_needs_layout = not self._spinner_uniform_width
 
     def _update_timer_display(self) -> None:
         """Compute and update timer display from timestamps.
@@ -824,7 +932,7 @@ class CommandLink(Horizontal, can_focus=True):
 
         Only updates if the display string has changed to avoid unnecessary refreshes.
         """
-        if not self._show_timer:
+        if not self._show_timer or not self._children_built:
             return
 
         import time
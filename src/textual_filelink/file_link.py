@@ -12,7 +12,7 @@ from textual.message import Message
 from textual.widgets import Static
 
 from .logging import get_logger
-from .utils import format_keyboard_shortcuts
+from .utils import absolute_path, format_keyboard_shortcuts, relative_to_cwd, sanitize_id
 
 _logger = get_logger()
 
@@ -78,6 +78,8 @@ class FileLink(Static, can_focus=True):
             The column number to navigate to, or None.
         """
 
+        __slots__ = ("widget", "path", "line", "column")
+
         def __init__(self, widget: FileLink, path: Path, line: Optional[int], column: Optional[int]) -> None:
             super().__init__()
             self.widget = widget
@@ -92,6 +94,8 @@ class FileLink(Static, can_focus=True):
         This alias will be removed in a future version.
         """
 
+        __slots__ = ()
+
         def __init__(self, widget: FileLink, path: Path, line: Optional[int], column: Optional[int]) -> None:
             warnings.warn(
                 "FileLink.Clicked is deprecated, use FileLink.Opened instead",
@@ -146,7 +150,9 @@ class FileLink(Static, can_focus=True):
         tooltip : Optional[str]
             Optional tooltip text. If provided, will be enhanced with keyboard shortcuts.
         """
-        self._path = Path(path).resolve()
+        # Absolute, but not symlink-resolved: abspath is pure string work, while
+        # resolve() would stat every path component for every link
+        self._path = absolute_path(path)
         self._display_name = display_name or self._path.name
         self._line = line
         self._column = column
@@ -158,8 +164,6 @@ class FileLink(Static, can_focus=True):
 
         # Auto-generate ID from filename if not provided
         if id is None:
-            from .utils import sanitize_id
-
             id = sanitize_id(self._path.name)
 
         # Initialize Static with the display name as content
@@ -334,11 +338,10 @@ class FileLink(Static, can_focus=True):
     @staticmethod
     def vscode_command(path: Path, line: Optional[int], column: Optional[int]) -> list[str]:
         """Build VSCode 'code --goto' command."""
-        try:
-            cwd = Path.cwd()
-            relative_path = path.relative_to(cwd)
+        relative_path = relative_to_cwd(path)
+        if relative_path is not None:
             file_arg = str(relative_path)
-        except ValueError:
+        else:
             _logger.debug(f"Using absolute path: {path}")
             file_arg = str(path)
 
@@ -451,7 +454,7 @@ class FileLink(Static, can_focus=True):
         column : Optional[int]
             New column number. If None, clears column.
         """
-        self._path = Path(path).resolve()
+        self._path = absolute_path(path)
         self._display_name = display_name or self._path.name
         self._line = line
         self._column = column
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import itertools
 from collections.abc import Iterable
-from typing import Optional
+from typing import Callable, Optional
 
 from textual.containers import Horizontal, VerticalScroll
 from textual.message import Message
@@ -21,6 +22,9 @@ class FileLinkListItem(Horizontal):
     Layout: [toggle?] item [remove?]
     """
 
+    # Toggle icon glyphs, indexed by toggle state
+    _TOGGLE_GLYPHS = ("☐", "☑")
+
     DEFAULT_CSS = """
     FileLinkListItem {
         width: 100%;
@@ -56,6 +60,7 @@ class FileLinkListItem(Horizontal):
         show_toggle: bool = False,
         show_remove: bool = False,
         initial_toggle: bool = False,
+        on_toggle_change: Optional[Callable[[FileLinkListItem], None]] = None,
     ) -> None:
         """Initialize the wrapper.
 
@@ -69,17 +74,24 @@ class FileLinkListItem(Horizontal):
             Whether to show remove button.
         initial_toggle : bool
             Initial toggle state (default: False).
+        on_toggle_change : Optional[Callable[[FileLinkListItem], None]]
+            Called with this wrapper whenever its toggle state changes.
         """
         super().__init__()
         self._item = item
         self._show_toggle = show_toggle
         self._show_remove = show_remove
         self._is_toggled = initial_toggle
+        self._on_toggle_change = on_toggle_change
+
+        # Direct references to the control widgets (None when disabled), so
+        # they never need to be looked up in the DOM
+        self._toggle_icon: Optional[Static] = None
+        self._remove_button: Optional[Static] = None
 
         # Create toggle icon if enabled
         if self._show_toggle:
-            icon = "☑" if initial_toggle else "☐"
-            self._toggle_icon = Static(icon, classes="toggle-icon")
+            self._toggle_icon = Static(self._TOGGLE_GLYPHS[initial_toggle], classes="toggle-icon")
             self._toggle_icon.tooltip = "Toggle selection"
 
         # Create remove button if enabled
@@ -89,18 +101,17 @@ class FileLinkListItem(Horizontal):
 
     def compose(self):
         """Compose the wrapper layout."""
-        if self._show_toggle:
+        if self._toggle_icon is not None:
             yield self._toggle_icon
         yield self._item
-        if self._show_remove:
+        if self._remove_button is not None:
             yield self._remove_button
 
     def on_click(self, event) -> None:
         """Handle clicks on toggle icon and remove button."""
         # Handle toggle icon click - update visual state
-        if self._show_toggle and event.widget == self._toggle_icon:
-            self._is_toggled = not self._is_toggled
-            self._toggle_icon.update("☑" if self._is_toggled else "☐")
+        if self._toggle_icon is not None and event.widget is self._toggle_icon:
+            self.set_toggled(not self._is_toggled)
             # Don't stop - let it bubble to FileLinkList for ItemToggled message
 
         # For remove button, don't stop - let it bubble to FileLinkList for removal
@@ -116,10 +127,15 @@ class FileLinkListItem(Horizontal):
         return self._is_toggled
 
     def set_toggled(self, value: bool) -> None:
-        """Set toggle state."""
-        if self._show_toggle:
+        """Set toggle state.
+
+        Does nothing if the state is unchanged, so bulk updates only touch rows that change.
+        """
+        if self._toggle_icon is not None and value != self._is_toggled:
             self._is_toggled = value
-            self._toggle_icon.update("☑" if value else "☐")
+            self._toggle_icon.update(self._TOGGLE_GLYPHS[value])
+            if self._on_toggle_change is not None:
+                self._on_toggle_change(self)
 
 
 class FileLinkList(VerticalScroll):
@@ -136,7 +152,8 @@ class FileLinkList(VerticalScroll):
     - Optional toggle controls for each item
     - Optional remove controls for each item
     - Batch operations: toggle_all(), remove_selected(), get_toggled_items()
-    - Messages: ItemToggled, ItemRemoved (expose wrapped widget, not wrapper)
+    - Messages: ItemToggled, ItemsToggled, ItemRemoved, ItemsRemoved, ItemsCleared
+      (expose wrapped widgets, not wrappers)
 
     Example
     -------
@@ -172,24 +189,77 @@ class FileLinkList(VerticalScroll):
             New toggle state.
         """
 
+        __slots__ = ("item", "is_toggled")
+
         def __init__(self, item: Widget, is_toggled: bool) -> None:
             super().__init__()
             self.item = item
             self.is_toggled = is_toggled
 
+    class ItemsToggled(Message):
+        """Posted once when toggle_all() sets the toggle state of every item.
+
+        Attributes
+        ----------
+        items : list[Widget]
+            The items whose toggle state was set.
+        is_toggled : bool
+            New toggle state shared by all items.
+        """
+
+        __slots__ = ("items", "is_toggled")
+
+        def __init__(self, items: list[Widget], is_toggled: bool) -> None:
+            super().__init__()
+            self.items = items
+            self.is_toggled = is_toggled
+
     class ItemRemoved(Message):
         """Posted when an item is removed.
 
         Attributes
         ----------
         item : Widget
-            The item that was removed.
+            The item that was removed. The list no longer references it, so
+            this message is what keeps it alive until handlers have run.
         """
 
+        __slots__ = ("item",)
+
         def __init__(self, item: Widget) -> None:
             super().__init__()
             self.item = item
 
+    class ItemsRemoved(Message):
+        """Posted once when remove_selected() removes the toggled items.
+
+        Attributes
+        ----------
+        items : list[Widget]
+            The items that were removed.
+        """
+
+        __slots__ = ("items",)
+
+        def __init__(self, items: list[Widget]) -> None:
+            super().__init__()
+            self.items = items
+
+    class ItemsCleared(Message):
+        """Posted once when clear_items() removes every item.
+
+        Attributes
+        ----------
+        items : list[Widget]
+            The items that were removed.
+        """
+
+        __slots__ = ("items",)
+
+        def __init__(self, items: list[Widget]) -> None:
+            super().__init__()
+            self.items = items
+
     def __init__(
         self,
         *,
@@ -214,8 +284,20 @@ class FileLinkList(VerticalScroll):
         super().__init__(id=id, classes=classes)
         self._show_toggles = show_toggles
         self._show_remove = show_remove
-        self._item_ids: set[str] = set()
-        self._wrappers: dict[str, FileLinkListItem] = {}
+        # Without any controls a wrapper would be an empty layer around each
+        # item, so items are mounted directly instead
+        self._uses_wrappers = show_toggles or show_remove
+        # Maps item ID to its FileLinkListItem wrapper, or to the item itself
+        # when wrappers are not used
+        self._wrappers: dict[str, Widget] = {}
+        # IDs of toggled items, plus each item's insertion position so toggled
+        # items can be returned in list order without scanning every wrapper
+        self._toggled_ids: set[str] = set()
+        self._positions: dict[str, int] = {}
+        self._position_counter = itertools.count()
+        # Reverse indexes from control widgets to their wrapper (O(1) click dispatch)
+        self._toggle_to_wrapper: dict[Widget, FileLinkListItem] = {}
+        self._remove_to_wrapper: dict[Widget, FileLinkListItem] = {}
 
     def add_item(
         self,
@@ -248,7 +330,7 @@ class FileLinkList(VerticalScroll):
             raise ValueError(f"Item must have an explicit ID set. Got: {item}")
 
         # Validate ID is unique
-        if item.id in self._item_ids:
+        if item.id in self._wrappers:
             _logger.error(f"Duplicate ID: {item.id}")
             raise ValueError(
                 f"Duplicate item ID: '{item.id}'. "
@@ -256,8 +338,14 @@ class FileLinkList(VerticalScroll):
                 f"Either use a different name or provide an explicit id parameter."
             )
 
-        # Track ID
-        self._item_ids.add(item.id)
+        self._positions[item.id] = next(self._position_counter)
+
+        # Fast path: no controls, so mount the item without a wrapper
+        if not self._uses_wrappers:
+            self._wrappers[item.id] = item
+            self.mount(item)
+            _logger.debug(f"Added item: id={item.id}")
+            return
 
         # Create wrapper
         wrapper = FileLinkListItem(
@@ -265,8 +353,12 @@ class FileLinkList(VerticalScroll):
             show_toggle=self._show_toggles,
             show_remove=self._show_remove,
             initial_toggle=toggled,
+            on_toggle_change=self._on_wrapper_toggle_change,
         )
         self._wrappers[item.id] = wrapper
+        if self._show_toggles and toggled:
+            self._toggled_ids.add(item.id)
+        self._index_controls(wrapper)
 
         # Mount the wrapper
         self.mount(wrapper)
@@ -280,39 +372,50 @@ class FileLinkList(VerticalScroll):
         item : Widget
             The item to remove (by ID).
         """
-        if item.id not in self._item_ids:
+        if item.id not in self._wrappers:
             return
 
         _logger.debug(f"Removed: {item.id}")
 
-        # Get wrapper
-        wrapper = self._wrappers[item.id]
-
         # Remove from tracking
-        self._item_ids.remove(item.id)
-        del self._wrappers[item.id]
+        entry = self._untrack(item.id)
 
-        # Remove wrapper from DOM
-        wrapper.remove()
+        # Remove wrapper (or unwrapped item) from DOM
+        entry.remove()
 
         # Post message
         self.post_message(self.ItemRemoved(item))
 
     def clear_items(self) -> None:
-        """Remove all items from the list."""
-        _logger.debug(f"Clearing {len(self._item_ids)} items")
+        """Remove all items from the list.
+
+        Removes every wrapper in one batch and posts a single ItemsCleared
+        message (no per-item ItemRemoved messages).
+        """
+        if not self._wrappers:
+            return
 
-        # Remove all wrappers
-        for wrapper in list(self._wrappers.values()):
-            wrapper.remove()
+        _logger.debug(f"Clearing {len(self._wrappers)} items")
+        items = self.get_items()
+
+        # Remove all wrappers (or unwrapped items) in one batch
+        self.remove_children(list(self._wrappers.values()))
 
         # Clear tracking
-        self._item_ids.clear()
         self._wrappers.clear()
+        self._positions.clear()
+        self._toggled_ids.clear()
+        self._toggle_to_wrapper.clear()
+        self._remove_to_wrapper.clear()
+
+        self.post_message(self.ItemsCleared(items))
 
     def toggle_all(self, value: bool) -> None:
         """Set all toggle checkboxes to the same value.
 
+        Posts a single ItemsToggled message covering every item, rather than
+        one ItemToggled message per item.
+
         Parameters
         ----------
         value : bool
@@ -321,22 +424,30 @@ class FileLinkList(VerticalScroll):
         if not self._show_toggles:
             return
 
-        for wrapper in self._wrappers.values():
-            wrapper.set_toggled(value)
-            # Post message for each toggle
-            self.post_message(self.ItemToggled(wrapper.item, value))
+        for entry in self._wrappers.values():
+            if isinstance(entry, FileLinkListItem):
+                entry.set_toggled(value)
+
+        self.post_message(self.ItemsToggled(self.get_items(), value))
 
     def remove_selected(self) -> None:
-        """Remove all toggled items from the list."""
-        if not self._show_toggles:
+        """Remove all toggled items from the list.
+
+        Removes the toggled wrappers in one batch and posts a single
+        ItemsRemoved message (no per-item ItemRemoved messages).
+        """
+        if not self._show_toggles or not self._toggled_ids:
             return
 
-        # Collect items to remove
-        to_remove = [wrapper.item for wrapper in self._wrappers.values() if wrapper.is_toggled]
+        _logger.debug(f"Removing {len(self._toggled_ids)} selected items")
+
+        # Remove from tracking (in list order), then remove the wrappers from the DOM in one batch
+        toggled_ids = sorted(self._toggled_ids, key=self._positions.__getitem__)
+        entries = [self._untrack(item_id) for item_id in toggled_ids]
+        removed = [self._item_of(entry) for entry in entries]
+        self.remove_children(entries)
 
-        # Remove them
-        for item in to_remove:
-            self.remove_item(item)
+        self.post_message(self.ItemsRemoved(removed))
 
     def get_toggled_items(self) -> list[Widget]:
         """Get all currently toggled items.
@@ -344,12 +455,15 @@ class FileLinkList(VerticalScroll):
         Returns
         -------
         list[Widget]
-            List of toggled items.
+            List of toggled items, in list order.
         """
         if not self._show_toggles:
             return []
 
-        return [wrapper.item for wrapper in self._wrappers.values() if wrapper.is_toggled]
+        return [
+            self._item_of(self._wrappers[item_id])
+            for item_id in sorted(self._toggled_ids, key=self._positions.__getitem__)
+        ]
 
     def get_items(self) -> list[Widget]:
         """Get all items in the list.
@@ -359,11 +473,51 @@ class FileLinkList(VerticalScroll):
         list[Widget]
             List of all items.
         """
-        return [wrapper.item for wrapper in self._wrappers.values()]
+        return [self._item_of(entry) for entry in self._wrappers.values()]
+
+    @staticmethod
+    def _item_of(entry: Widget) -> Widget:
+        """Return the item for a tracked entry (a wrapper or the item itself)."""
+        return entry.item if isinstance(entry, FileLinkListItem) else entry
+
+    def _untrack(self, item_id: str) -> Widget:
+        """Drop an item from all tracking structures and return its entry."""
+        entry = self._wrappers.pop(item_id)
+        del self._positions[item_id]
+        self._toggled_ids.discard(item_id)
+        if isinstance(entry, FileLinkListItem):
+            self._unindex_controls(entry)
+            # Detach the callback so a stale wrapper can't call back into this list
+            entry._on_toggle_change = None
+        return entry
+
+    def _on_wrapper_toggle_change(self, wrapper: FileLinkListItem) -> None:
+        """Keep the toggled-ID set in sync with a wrapper's toggle state."""
+        item_id = wrapper.item.id
+        if item_id not in self._wrappers:
+            return
+        if wrapper.is_toggled:
+            self._toggled_ids.add(item_id)
+        else:
+            self._toggled_ids.discard(item_id)
+
+    def _index_controls(self, wrapper: FileLinkListItem) -> None:
+        """Register a wrapper's toggle icon and remove button for click dispatch."""
+        if wrapper._toggle_icon is not None:
+            self._toggle_to_wrapper[wrapper._toggle_icon] = wrapper
+        if wrapper._remove_button is not None:
+            self._remove_to_wrapper[wrapper._remove_button] = wrapper
+
+    def _unindex_controls(self, wrapper: FileLinkListItem) -> None:
+        """Drop a wrapper's controls from the click dispatch indexes."""
+        if wrapper._toggle_icon is not None:
+            self._toggle_to_wrapper.pop(wrapper._toggle_icon, None)
+        if wrapper._remove_button is not None:
+            self._remove_to_wrapper.pop(wrapper._remove_button, None)
 
     def __len__(self) -> int:
         """Get number of items in the list."""
-        return len(self._item_ids)
+        return len(self._wrappers)
 
     def __iter__(self) -> Iterable[Widget]:
         """Iterate over items in the list."""
@@ -374,18 +528,17 @@ class FileLinkList(VerticalScroll):
     # ------------------------------------------------------------------ #
     def on_click(self, event) -> None:
         """Handle clicks on toggle icons and remove buttons in wrapper items."""
-        # Check each wrapper for toggle icon or remove button clicks
-        for wrapper in self._wrappers.values():
-            # Handle toggle icon click
-            if self._show_toggles and hasattr(wrapper, "_toggle_icon") and wrapper._toggle_icon == event.widget:
-                # Post ItemToggled message
-                self.post_message(self.ItemToggled(wrapper.item, wrapper.is_toggled))
-                event.stop()
-                return
-
-            # Handle remove button click
-            if self._show_remove and hasattr(wrapper, "_remove_button") and wrapper._remove_button == event.widget:
-                # Remove the item
-                self.remove_item(wrapper.item)
-                event.stop()
-                return
+        # Handle toggle icon click
+        wrapper = self._toggle_to_wrapper.get(event.widget)
+        if wrapper is not None:
+            # Post ItemToggled message
+            self.post_message(self.ItemToggled(wrapper.item, wrapper.is_toggled))
+            event.stop()
+            return
+
+        # Handle remove button click
+        wrapper = self._remove_to_wrapper.get(event.widget)
+        if wrapper is not None:
+            # Remove the item
+            self.remove_item(wrapper.item)
+            event.stop()
@@ -13,7 +13,7 @@ from textual.widgets import Static
 from .file_link import FileLink
 from .icon import Icon
 from .logging import get_logger
-from .utils import format_keyboard_shortcuts
+from .utils import format_keyboard_shortcuts, sanitize_id
 
 _logger = get_logger()
 
@@ -68,6 +68,9 @@ class FileLinkWithIcons(Horizontal, can_focus=True):
         Binding("o", "open_file", "Open file", show=False),
     ]
 
+    # Icon widget classes, indexed by Icon.clickable
+    _ICON_CLASSES = ("icon-widget", "icon-widget clickable")
+
     class IconClicked(Message):
         """Posted when a clickable icon is clicked.
 
@@ -83,6 +86,8 @@ class FileLinkWithIcons(Horizontal, can_focus=True):
             The unicode character displayed for the icon.
         """
 
+        __slots__ = ("widget", "path", "icon_name", "icon_char")
+
         def __init__(
             self,
             widget: FileLinkWithIcons,
@@ -147,9 +152,24 @@ class FileLinkWithIcons(Horizontal, can_focus=True):
         self._icons_before = icons_before or []
         self._icons_after = icons_after or []
         self._validate_icons()
+        # Name -> Icon index for lookups (names are unique; icons are updated in place)
+        self._icons_by_name: dict[str, Icon] = {icon.name: icon for icon in self._icons_before + self._icons_after}
 
-        # Store internal state
-        self._path = Path(path).resolve()
+        # Create internal FileLink (embedded to prevent focus stealing)
+        self._file_link = FileLink(
+            path,
+            display_name=display_name,
+            line=line,
+            column=column,
+            command_builder=command_builder,
+            command_template=command_template,  # Forward template to embedded FileLink
+            open_keys=open_keys,  # Forward custom keys to embedded FileLink
+            _embedded=True,
+            tooltip=None,  # No tooltip on embedded FileLink
+        )
+
+        # Store internal state (reuse the FileLink's absolute path rather than computing it again)
+        self._path = self._file_link.path
         self._line = line
         self._column = column
 
@@ -158,8 +178,6 @@ class FileLinkWithIcons(Horizontal, can_focus=True):
 
         # Auto-generate ID from filename if not provided
         if id is None:
-            from .utils import sanitize_id
-
             id = sanitize_id(self._path.name)
 
         # Initialize container (bindings will be added dynamically in on_mount)
@@ -172,21 +190,10 @@ class FileLinkWithIcons(Horizontal, can_focus=True):
         # Store custom tooltip for later enhancement with all shortcuts
         self._custom_tooltip = tooltip
 
-        # Create internal FileLink (embedded to prevent focus stealing)
-        self._file_link = FileLink(
-            path,
-            display_name=display_name,
-            line=line,
-            column=column,
-            command_builder=command_builder,
-            command_template=command_template,  # Forward template to embedded FileLink
-            open_keys=open_keys,  # Forward custom keys to embedded FileLink
-            _embedded=True,
-            tooltip=None,  # No tooltip on embedded FileLink
-        )
-
         # Create icon widgets
         self._icon_widgets: dict[str, Static] = {}
+        # Reverse index from clickable icon widgets to their Icon (O(1) click dispatch)
+        self._clickable_icons: dict[Static, Icon] = {}
 
     def _validate_icons(self) -> None:
         """Validate icon configuration (fail fast on errors)."""
@@ -270,35 +277,37 @@ class FileLinkWithIcons(Horizontal, can_focus=True):
 
     def _create_icon_widget(self, icon: Icon) -> Static:
         """Create a Static widget for an icon."""
-        classes = "icon-widget"
-        if icon.clickable:
-            classes += " clickable"
-
         # Create widget (no ID needed - we track by name in _icon_widgets dict)
-        widget = Static(icon.icon, classes=classes)
+        widget = Static(icon.icon, classes=self._ICON_CLASSES[icon.clickable])
 
         # Set tooltip (enhanced with keyboard shortcut if applicable)
-        if icon.tooltip or icon.key:
-            tooltip = icon.tooltip or f"Activate {icon.name}"
-            if icon.key:
-                tooltip = f"{tooltip} ({icon.key})"
+        tooltip = self._icon_tooltip(icon)
+        if tooltip is not None:
             widget.tooltip = tooltip
 
-        # Handle clicks if clickable - store metadata directly
+        # Handle clicks if clickable
         if icon.clickable:
-            widget._icon_name = icon.name  # type: ignore
-            widget._icon_char = icon.icon  # type: ignore
+            self._clickable_icons[widget] = icon
 
         return widget
 
+    @staticmethod
+    def _icon_tooltip(icon: Icon) -> Optional[str]:
+        """Get an icon's tooltip, enhanced with its keyboard shortcut if it has one."""
+        if not (icon.tooltip or icon.key):
+            return None
+        tooltip = icon.tooltip or f"Activate {icon.name}"
+        if icon.key:
+            tooltip = f"{tooltip} ({icon.key})"
+        return tooltip
+
     def on_click(self, event) -> None:
         """Handle clicks on icon widgets."""
-        # Check if click target is an icon widget
-        if hasattr(event.widget, "_icon_name"):
+        # Check if click target is a clickable icon widget
+        icon = self._clickable_icons.get(event.widget)
+        if icon is not None:
             event.stop()
-            icon_name = event.widget._icon_name  # type: ignore
-            icon_char = event.widget._icon_char  # type: ignore
-            self.post_message(self.IconClicked(self, self._path, icon_name, icon_char))
+            self.post_message(self.IconClicked(self, self._path, icon.name, icon.icon))
 
     def action_open_file(self) -> None:
         """Open the file in the configured editor (keyboard shortcut handler)."""
@@ -371,12 +380,22 @@ class FileLinkWithIcons(Horizontal, can_focus=True):
 
         # Update properties
         valid_props = {"icon", "tooltip", "clickable", "visible", "key"}
+        was_visible, was_clickable, old_char = icon.visible, icon.clickable, icon.icon
         for key, value in kwargs.items():
             if key not in valid_props:
                 raise ValueError(f"Invalid icon property: {key}")
             setattr(icon, key, value)
 
-        # Re-render icons (visibility or content may have changed)
+        # Update the existing widget in place when only its content changed;
+        # visibility or clickability changes re-render all icons
+        widget = self._icon_widgets.get(name)
+        if widget is not None and icon.visible == was_visible and icon.clickable == was_clickable:
+            # Skip the re-render when the glyph is unchanged (e.g. repeated status polls)
+            if icon.icon != old_char:
+                widget.update(icon.icon)
+            widget.tooltip = self._icon_tooltip(icon)
+            return
+
         self._rerender_icons()
 
     def set_icon_visible(self, name: str, visible: bool) -> None:
@@ -418,11 +437,7 @@ class FileLinkWithIcons(Horizontal, can_focus=True):
 
     def _get_icon_by_name(self, name: str) -> Optional[Icon]:
         """Helper to find icon by name in both lists."""
-        all_icons = self._icons_before + self._icons_after
-        for icon in all_icons:
-            if icon.name == name:
-                return icon
-        return None
+        return self._icons_by_name.get(name)
 
     def _rerender_icons(self) -> None:
         """Re-render all icons (called after visibility/content changes)."""
@@ -430,6 +445,7 @@ class FileLinkWithIcons(Horizontal, can_focus=True):
         for widget in list(self._icon_widgets.values()):
             widget.remove()
         self._icon_widgets.clear()
+        self._clickable_icons.clear()
 
         # Re-create visible icons before FileLink
         for icon in self._icons_before:
@@ -492,7 +508,7 @@ class FileLinkWithIcons(Horizontal, can_focus=True):
         column : Optional[int]
             New column number. If None, clears column.
         """
-        self._path = Path(path).resolve()
+        self._file_link.set_path(path, display_name, line, column)
+        self._path = self._file_link.path
         self._line = line
         self._column = column
-        self._file_link.set_path(path, display_name, line, column)
@@ -1,9 +1,11 @@
 """Utility functions for textual-filelink."""
 
+import functools
+import os
 import re
 import shlex
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Optional, Union
 
 # Allowed template variables for command_from_template
 ALLOWED_VARIABLES = {
@@ -18,12 +20,21 @@ ALLOWED_VARIABLES = {
     "column_plus",
 }
 
+# Template placeholders, e.g. "{{ line }}"
+_TEMPLATE_VARIABLE_RE = re.compile(r"\{\{\s*(\w+)\s*\}\}")
 
+# Characters not allowed in widget IDs. \w matches exactly what str.isalnum()
+# accepts plus "_", so spaces and path separators are covered too.
+_INVALID_ID_CHARS_RE = re.compile(r"[^\w-]")
+
+
+@functools.lru_cache(maxsize=1024)
 def sanitize_id(name: str) -> str:
     """Convert name to valid widget ID.
 
     Sanitizes for use as Textual widget ID: lowercase, spaces→hyphens,
     path separators→hyphens, keep only alphanumeric/hyphens/underscores.
+    Results are cached, since the same names are sanitized repeatedly.
 
     Parameters
     ----------
@@ -47,16 +58,8 @@ def sanitize_id(name: str) -> str:
     >>> sanitize_id("src\\\\file.py")
     'src-file-py'
     """
-    # Convert to lowercase
-    sanitized = name.lower()
-
-    # Replace spaces and path separators with hyphens
-    sanitized = sanitized.replace(" ", "-")
-    sanitized = sanitized.replace("/", "-")
-    sanitized = sanitized.replace("\\", "-")
-
-    # Keep only alphanumeric, hyphens, and underscores
-    return "".join(c if c.isalnum() or c in ("-", "_") else "-" for c in sanitized)
+    # Lowercase, then replace everything but alphanumerics, hyphens, and underscores
+    return _INVALID_ID_CHARS_RE.sub("-", name.lower())
 
 
 def format_keyboard_shortcuts(keys: list[str]) -> str:
@@ -86,6 +89,55 @@ def format_keyboard_shortcuts(keys: list[str]) -> str:
     return f"({'/'.join(keys)})"
 
 
+def absolute_path(path: Union[Path, str]) -> Path:
+    """Make a path absolute without resolving symlinks.
+
+    A Path that is already absolute and free of ".." segments is returned as-is,
+    so passing an existing widget path back in costs no string round-trip or re-parse.
+
+    Parameters
+    ----------
+    path : Union[Path, str]
+        Path to make absolute.
+
+    Returns
+    -------
+    Path
+        Absolute, normalized path (as from ``os.path.abspath``).
+    """
+    if isinstance(path, Path) and path.is_absolute() and ".." not in path.parts:
+        return path
+    return Path(os.path.abspath(path))
+
+
+def relative_to_cwd(path: Path) -> Optional[Path]:
+    """Get path relative to the current working directory, if it is inside it.
+
+    Compares path components directly instead of letting ``Path.relative_to``
+    raise ValueError for paths outside the working directory. Components are
+    compared with ``os.path.normcase``, so on Windows (like ``relative_to``)
+    drive-letter and directory case differences still match.
+
+    Parameters
+    ----------
+    path : Path
+        Path to make relative (normally absolute).
+
+    Returns
+    -------
+    Optional[Path]
+        The relative path, or None if path is not inside the working directory.
+    """
+    cwd_parts = Path.cwd().parts
+    parts = path.parts
+    depth = len(cwd_parts)
+    if len(parts) < depth or any(
+        os.path.normcase(part) != os.path.normcase(cwd_part) for part, cwd_part in zip(parts, cwd_parts)
+    ):
+        return None
+    return Path(*parts[depth:])
+
+
 def format_duration(secs: float) -> str:
     """Format seconds into a human-readable duration string.
 
@@ -188,9 +240,13 @@ def format_time_ago(secs: float) -> str:
     return f"{weeks}w ago"
 
 
+@functools.lru_cache(maxsize=64)
 def command_from_template(template: str) -> Callable[[Path, Optional[int], Optional[int]], list[str]]:
     """Create a command builder from a template string.
 
+    Builders are cached per template, so repeated calls with the same template
+    (e.g. each time a FileLink opens a file) skip validation and return the same builder.
+
     Supports Jinja2-style template variables:
     - {{ path }} - Full absolute path
     - {{ path_relative }} - Path relative to cwd (falls back to absolute)
@@ -241,7 +297,7 @@ def command_from_template(template: str) -> Callable[[Path, Optional[int], Optio
     a custom builder function instead.
     """
     # Validate template - find all {{ var }} patterns
-    variables = re.findall(r"\{\{\s*(\w+)\s*\}\}", template)
+    variables = _TEMPLATE_VARIABLE_RE.findall(template)
     unknown = set(variables) - ALLOWED_VARIABLES
 
     if unknown:
@@ -250,12 +306,10 @@ def command_from_template(template: str) -> Callable[[Path, Optional[int], Optio
     def builder(path: Path, line: Optional[int], column: Optional[int]) -> list[str]:
         """Build command from template with given path, line, and column."""
         # Compute path variants
-        path_abs = str(path.resolve())
-        try:
-            path_rel = str(path.relative_to(Path.cwd()))
-        except ValueError:
-            # Can't make relative, use absolute
-            path_rel = path_abs
+        path_abs = os.path.abspath(path)
+        relative_path = relative_to_cwd(path)
+        # Outside the working directory, fall back to the absolute path
+        path_rel = str(relative_path) if relative_path is not None else path_abs
         path_name = path.name
 
         # Start with the template
@@ -2,12 +2,23 @@
 # tests/conftest.py
 """Pytest configuration and shared fixtures."""
 
+import inspect
+
 import pytest
 
 
-@pytest.fixture
-def sample_files(tmp_path):
-    """Create a set of sample files for testing."""
+@pytest.fixture(scope="session")
+def temp_file(tmp_path_factory):
+    """Create a temporary file, shared by the whole session (no test modifies it)."""
+    file_path = tmp_path_factory.mktemp("temp-file") / "test.txt"
+    file_path.write_text("test content")
+    return file_path
+
+
+@pytest.fixture(scope="session")
+def sample_files(tmp_path_factory):
+    """Create a set of sample files for testing, shared by the whole session."""
+    tmp_path = tmp_path_factory.mktemp("sample-files")
     files = []
 
     # Create various test files
@@ -21,9 +32,10 @@ def sample_files(tmp_path):
     return files
 
 
-@pytest.fixture
-def sample_directory_structure(tmp_path):
-    """Create a directory structure for testing."""
+@pytest.fixture(scope="session")
+def sample_directory_structure(tmp_path_factory):
+    """Create a directory structure for testing, shared by the whole session."""
+    tmp_path = tmp_path_factory.mktemp("sample-tree")
     # Create nested directories with files
     (tmp_path / "src").mkdir()
     (tmp_path / "src" / "main.py").write_text("main content")
@@ -38,29 +50,29 @@ def sample_directory_structure(tmp_path):
     return tmp_path
 
 
-@pytest.fixture
-def long_filename(tmp_path):
+@pytest.fixture(scope="session")
+def long_filename(tmp_path_factory):
     """Create a file with a very long name."""
     long_name = "a" * 100 + ".txt"
-    file_path = tmp_path / long_name
+    file_path = tmp_path_factory.mktemp("long-name") / long_name
     file_path.write_text("content")
     return file_path
 
 
-@pytest.fixture
-def special_char_filename(tmp_path):
+@pytest.fixture(scope="session")
+def special_char_filename(tmp_path_factory):
     """Create a file with special characters in the name."""
     special_name = "test-file_with (special) chars & symbols.txt"
-    file_path = tmp_path / special_name
+    file_path = tmp_path_factory.mktemp("special-chars") / special_name
     file_path.write_text("content")
     return file_path
 
 
-@pytest.fixture
-def unicode_filename(tmp_path):
+@pytest.fixture(scope="session")
+def unicode_filename(tmp_path_factory):
     """Create a file with unicode characters."""
     unicode_name = "my_🔥_test.txt"
-    file_path = tmp_path / unicode_name
+    file_path = tmp_path_factory.mktemp("unicode-name") / unicode_name
     file_path.write_text("unicode content")
     return file_path
 
@@ -85,5 +97,15 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "integration: marks tests as integration tests")
 
 
+def pytest_collection_modifyitems(items):
+    """Mark async tests as integration tests.
+
+    Async tests drive a Textual app, so ``-m "not integration"`` runs only the quick sync tests.
+    """
+    for item in items:
+        if inspect.iscoroutinefunction(getattr(item, "function", None)):
+            item.add_marker(pytest.mark.integration)
+
+
 # Enable async tests
 pytest_plugins = ["pytest_asyncio"]
@@ -1,11 +1,21 @@
 # tests/test_command_link.py
 """Tests for CommandLink widget (flat architecture, v0.4.0)."""
 
+import asyncio
+from pathlib import Path
+from unittest.mock import patch
+
 import pytest
+import pytest_asyncio
 from textual.app import App, ComposeResult
+from textual.containers import Container, Vertical
+from textual.widgets import Static
 
 from textual_filelink import CommandLink, FileLink
 
+# Any absolute path works as an output path; the file need not exist until it's opened.
+OUTPUT_PATH = Path(__file__).resolve()
+
 
 class CommandLinkTestApp(App):
     """Test app for CommandLink."""
@@ -34,324 +44,343 @@ class CommandLinkTestApp(App):
         self.output_clicked_events.append(event)
 
 
-@pytest.fixture
-def temp_output_file(tmp_path):
-    """Create a temporary output file for testing."""
-    output_file = tmp_path / "output.log"
+@pytest.fixture(scope="module")
+def temp_output_file(tmp_path_factory):
+    """Create a temporary output file, shared by the module's tests (none of them modify it)."""
+    output_file = tmp_path_factory.mktemp("command-output") / "output.log"
     output_file.write_text("command output")
     return output_file
 
 
-class TestCommandLinkInitialization:
-    """Test suite for CommandLink initialization."""
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def shared_pilot():
+    """One running test app, hosting an empty container, shared by a module's tests.
 
-    def test_initialization_defaults(self):
-        """Test CommandLink initializes with default values."""
-        link = CommandLink("TestCommand")
+    Starting a Textual app is the dominant per-test cost, so tests that only need
+    a mounted link use mount_link() against this app instead of run_test().
+    Tests using it must run on the module event loop, which is the suite default
+    (asyncio_default_test_loop_scope in pyproject.toml).
+    """
+    app = CommandLinkTestApp(Container())
+    async with app.run_test() as pilot:
+        yield pilot
 
-        assert link.command_name == "TestCommand"  # command_name property returns actual name
-        assert link.output_path is None
-        assert link.is_running is False
 
-    def test_initialization_with_output_path(self, temp_output_file):
-        """Test CommandLink initializes with output path."""
-        link = CommandLink("TestCommand", output_path=temp_output_file)
+@pytest_asyncio.fixture(loop_scope="module")
+async def mount_link(shared_pilot):
+    """Mount a CommandLink into the shared app; it is removed again after the test."""
+    app = shared_pilot.app
+    mounted = []
 
-        assert link.output_path == temp_output_file
+    async def _mount(link):
+        for events in (
+            app.play_clicked_events,
+            app.stop_clicked_events,
+            app.settings_clicked_events,
+            app.output_clicked_events,
+        ):
+            events.clear()
+        await app.widget.mount(link)
+        await shared_pilot.pause()
+        mounted.append(link)
+        return shared_pilot
 
-    def test_auto_generated_id(self):
-        """Test command name is sanitized and used as widget ID."""
-        link = CommandLink("Test Command")
+    yield _mount
 
-        assert link.id == "test-command"  # ID is sanitized
+    for link in mounted:
+        await link.remove()
 
-    def test_explicit_id(self):
-        """Test explicit ID overrides auto-generated ID."""
-        link = CommandLink("Test Command", id="my-custom-id")
 
-        assert link.id == "my-custom-id"
+@pytest.fixture
+def no_spinner_timer(monkeypatch):
+    """Keep running links from starting the spinner timer, for tests that don't check the spinner."""
+    monkeypatch.setattr(CommandLink, "_start_spinner", lambda self: None)
 
-    async def test_has_status_widget(self):
-        """Test CommandLink has status widget."""
-        link = CommandLink("TestCommand")
-        app = CommandLinkTestApp(link)
 
-        async with app.run_test():
-            status_widgets = link.query(".status-icon")
-            assert len(status_widgets) == 1
+def count_composed(link, css_class):
+    """Count the children a link's compose() yields with the given class (no app needed)."""
+    return sum(css_class in child.classes for child in link.compose())
 
-    async def test_has_play_stop_button(self):
-        """Test CommandLink has play/stop button."""
-        link = CommandLink("TestCommand")
-        app = CommandLinkTestApp(link)
 
-        async with app.run_test():
-            play_stop_widgets = link.query(".play-stop-button")
-            assert len(play_stop_widgets) == 1
+class TestCommandLinkInitialization:
+    """Test suite for CommandLink initialization."""
+
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            # Defaults
+            ({}, {"command_name": "TestCommand", "output_path": None, "is_running": False}),
+            # command_name returns the name as given
+            ({"command_name": "My Test Command"}, {"command_name": "My Test Command"}),
+            ({"output_path": OUTPUT_PATH}, {"output_path": OUTPUT_PATH}),
+            # ID is the sanitized command name
+            ({"command_name": "Test Command"}, {"id": "test-command"}),
+            # Explicit ID overrides the auto-generated one
+            ({"command_name": "Test Command", "id": "my-custom-id"}, {"id": "my-custom-id"}),
+        ],
+    )
+    def test_initialization_attributes(self, kwargs, expected):
+        """Test CommandLink constructor arguments are reflected in its attributes."""
+        kwargs = {"command_name": "TestCommand", **kwargs}
+        link = CommandLink(**kwargs)
+
+        for name, value in expected.items():
+            assert getattr(link, name) == value, name
+
+    def test_has_status_widget(self):
+        """Test CommandLink has status widget."""
+        assert count_composed(CommandLink("TestCommand"), "status-icon") == 1
 
-    async def test_name_widget_is_static_without_output(self):
+    def test_has_play_stop_button(self):
+        """Test CommandLink has play/stop button."""
+        assert count_composed(CommandLink("TestCommand"), "play-stop-button") == 1
+
+    def test_name_widget_is_static_without_output(self):
         """Test name is Static widget when no output_path."""
         link = CommandLink("TestCommand")
-        app = CommandLinkTestApp(link)
+        list(link.compose())
 
-        async with app.run_test():
-            # Name widget should be Static, not FileLink
-            assert link._name_widget.__class__.__name__ == "Static"
+        # Name widget should be Static, not FileLink
+        assert type(link._name_widget) is Static
 
-    async def test_name_widget_is_filelink_with_output(self, temp_output_file):
+    def test_name_widget_is_filelink_with_output(self, temp_output_file):
         """Test name is FileLink widget when output_path is set."""
         link = CommandLink("TestCommand", output_path=temp_output_file)
-        app = CommandLinkTestApp(link)
+        list(link.compose())
 
-        async with app.run_test():
-            # Name widget should be FileLink
-            assert isinstance(link._name_widget, FileLink)
-            assert link._name_widget.path == temp_output_file
+        # Name widget should be FileLink
+        assert isinstance(link._name_widget, FileLink)
+        assert link._name_widget.path == temp_output_file
 
-    async def test_settings_icon_hidden_by_default(self):
+    def test_settings_icon_hidden_by_default(self):
         """Test settings icon is hidden by default."""
-        link = CommandLink("TestCommand")
-        app = CommandLinkTestApp(link)
-
-        async with app.run_test():
-            settings_widgets = link.query(".settings-icon")
-            assert len(settings_widgets) == 0
+        assert count_composed(CommandLink("TestCommand"), "settings-icon") == 0
 
-    async def test_settings_icon_visible_when_enabled(self):
+    def test_settings_icon_visible_when_enabled(self):
         """Test settings icon is visible when show_settings=True."""
-        link = CommandLink("TestCommand", show_settings=True)
-        app = CommandLinkTestApp(link)
+        assert count_composed(CommandLink("TestCommand", show_settings=True), "settings-icon") == 1
 
-        async with app.run_test():
-            settings_widgets = link.query(".settings-icon")
-            assert len(settings_widgets) == 1
+    def test_child_widgets_not_created_before_compose(self):
+        """Test an unmounted CommandLink doesn't allocate its child widgets."""
+        link = CommandLink("TestCommand", show_timer=True)
+
+        assert link._children_built is False
+        assert not hasattr(link, "_status_widget")
+        assert not hasattr(link, "_play_stop_widget")
+        assert not hasattr(link, "_name_widget")
+
+    async def test_state_set_before_mount_applied_on_compose(self, mount_link, temp_output_file):
+        """Test setters called before mounting are reflected in the composed children."""
+        link = CommandLink("TestCommand")
+        link.set_status(icon="✅", tooltip="Passed", running=True, stop_tooltip="Cancel")
+        link.set_output_path(temp_output_file)
+        link.set_name_tooltip("Build project", append_shortcuts=False)
+        await mount_link(link)
+
+        assert link._status_widget.tooltip == "Passed"
+        assert link._play_stop_widget.content == "⏹️"
+        assert link._play_stop_widget.tooltip == "Cancel (space/p)"
+        assert isinstance(link._name_widget, FileLink)
+        assert link._name_widget.tooltip == "Build project"
 
 
+@pytest.mark.usefixtures("no_spinner_timer")
 class TestCommandLinkStatus:
     """Test suite for CommandLink status management."""
 
-    async def test_initial_status_icon(self):
+    async def test_initial_status_icon(self, mount_link):
         """Test initial status icon is set correctly."""
         link = CommandLink("TestCommand", initial_status_icon="✅")
-        app = CommandLinkTestApp(link)
+        await mount_link(link)
 
-        async with app.run_test():
-            assert link._status_icon == "✅"
-            assert "✅" in str(link._status_widget.render())
+        assert link._status_icon == "✅"
+        # Other status tests read widget content directly; render once here
+        assert "✅" in str(link._status_widget.render())
 
-    async def test_set_status_updates_icon(self):
+    async def test_set_status_updates_icon(self, mount_link):
         """Test set_status() updates the status icon."""
         link = CommandLink("TestCommand")
-        app = CommandLinkTestApp(link)
+        await mount_link(link)
 
-        async with app.run_test() as pilot:
-            link.set_status(icon="✅")
-            await pilot.pause()
+        link.set_status(icon="✅")
 
-            assert link._status_icon == "✅"
-            assert "✅" in str(link._status_widget.render())
+        assert link._status_icon == "✅"
+        assert link._status_widget.content == "✅"
 
-    async def test_set_status_running_starts_spinner(self):
-        """Test set_status(running=True) starts spinner animation."""
-        link = CommandLink("TestCommand")
-        app = CommandLinkTestApp(link)
+    async def test_set_status_skips_unchanged_icon(self, mount_link):
+        """Test set_status() with the current icon does not re-render the status widget."""
+        link = CommandLink("TestCommand", initial_status_icon="✅")
+        await mount_link(link)
 
-        async with app.run_test() as pilot:
-            # Start the spinner via set_interval mechanism
-            link.set_status(running=True)
-            await pilot.pause()
+        with patch.object(link._status_widget, "update") as mock_update:
+            link.set_status(icon="✅")
+            mock_update.assert_not_called()
 
-            assert link.is_running is True
-            # Spinner timer is created asynchronously via set_interval
-            # Just verify is_running changed
-            assert link._status_icon == "❓"  # Original icon is preserved during spinner
+            link.set_status(icon="❌")
+            mock_update.assert_called_once_with("❌")
 
-    async def test_set_status_not_running_stops_spinner(self):
-        """Test set_status(running=False) stops spinner."""
+    async def test_set_status_running_transitions(self, mount_link):
+        """Test set_status() moves between idle, running and stopped on one mounted link."""
         link = CommandLink("TestCommand")
-        app = CommandLinkTestApp(link)
+        await mount_link(link)
 
-        async with app.run_test() as pilot:
-            # Start spinner
-            link.set_status(running=True)
-            await pilot.pause()
-            assert link.is_running is True
-
-            # Stop spinner and set icon
-            link.set_status(icon="✅", running=False)
-            await pilot.pause()
-
-            assert link.is_running is False
-            assert link._status_icon == "✅"
-            assert "✅" in str(link._status_widget.render())
-
-    async def test_set_status_updates_play_stop_button(self):
-        """Test set_status() updates play/stop button."""
-        link = CommandLink("TestCommand")
-        app = CommandLinkTestApp(link)
-
-        async with app.run_test() as pilot:
-            # Initially shows play button
-            assert "▶️" in str(link._play_stop_widget.render())
+        # Idle: play button
+        assert link.is_running is False
+        assert link._play_stop_widget.content == "▶️"
 
-            # Running shows stop button
-            link.set_status(running=True)
-            await pilot.pause()
-            assert "⏹️" in str(link._play_stop_widget.render())
+        # Running: spinner starts, stop button shows, original icon is kept for afterwards
+        link.set_status(running=True)
+        assert link.is_running is True
+        assert link._status_icon == "❓"
+        assert link._play_stop_widget.content == "⏹️"
 
-            # Not running shows play button
-            link.set_status(running=False)
-            await pilot.pause()
-            assert "▶️" in str(link._play_stop_widget.render())
+        # Stopped with a new icon: spinner stops and the icon is shown
+        link.set_status(icon="✅", running=False)
+        assert link.is_running is False
+        assert link._status_icon == "✅"
+        assert link._status_widget.content == "✅"
+        assert link._play_stop_widget.content == "▶️"
 
-    async def test_set_status_updates_tooltip(self):
+    async def test_set_status_updates_tooltip(self, mount_link):
         """Test set_status() updates status tooltip."""
         link = CommandLink("TestCommand")
-        app = CommandLinkTestApp(link)
+        await mount_link(link)
 
-        async with app.run_test() as pilot:
-            link.set_status(tooltip="Running tests...")
-            await pilot.pause()
+        link.set_status(tooltip="Running tests...")
 
-            assert link._status_widget.tooltip == "Running tests..."
+        assert link._status_widget.tooltip == "Running tests..."
 
-    async def test_set_status_updates_all_tooltips(self):
+    async def test_set_status_updates_all_tooltips(self, mount_link):
         """Test set_status() can update all tooltips at once."""
         link = CommandLink("TestCommand")
-        app = CommandLinkTestApp(link)
-
-        async with app.run_test() as pilot:
-            # Update all tooltips together
-            link.set_status(
-                icon="⏳",
-                running=True,
-                tooltip="Building project",
-                name_tooltip="Project build",
-                run_tooltip="Start building",
-                stop_tooltip="Stop building",
-            )
-            await pilot.pause()
+        await mount_link(link)
+
+        # Update all tooltips together
+        link.set_status(
+            icon="⏳",
+            running=True,
+            tooltip="Building project",
+            name_tooltip="Project build",
+            run_tooltip="Start building",
+            stop_tooltip="Stop building",
+        )
 
-            # Verify all tooltips were updated
-            assert link._status_widget.tooltip == "Building project"
-            assert "Project build" in link._name_widget.tooltip
-            assert link._custom_run_tooltip == "Start building (space/p)"
-            assert link._custom_stop_tooltip == "Stop building (space/p)"
-            assert link._play_stop_widget.tooltip == "Stop building (space/p)"  # Currently running
+        # Verify all tooltips were updated
+        assert link._status_widget.tooltip == "Building project"
+        assert "Project build" in link._name_widget.tooltip
+        assert link._custom_run_tooltip == "Start building (space/p)"
+        assert link._custom_stop_tooltip == "Stop building (space/p)"
+        assert link._play_stop_widget.tooltip == "Stop building (space/p)"  # Currently running
 
-            # Change to not running
-            link.set_status(running=False, icon="✅")
-            await pilot.pause()
+        # Change to not running
+        link.set_status(running=False, icon="✅")
 
-            # Play button should now show run tooltip
-            assert link._play_stop_widget.tooltip == "Start building (space/p)"
+        # Play button should now show run tooltip
+        assert link._play_stop_widget.tooltip == "Start building (space/p)"
 
-    async def test_set_status_tooltips_without_shortcuts(self):
+    async def test_set_status_tooltips_without_shortcuts(self, mount_link):
         """Test set_status() tooltip appending can be disabled."""
         link = CommandLink("TestCommand")
-        app = CommandLinkTestApp(link)
-
-        async with app.run_test() as pilot:
-            # Update tooltips without shortcuts
-            link.set_status(
-                name_tooltip="Just the name",
-                run_tooltip="Just run",
-                stop_tooltip="Just stop",
-                append_shortcuts=False,
-            )
-            await pilot.pause()
+        await mount_link(link)
+
+        # Update tooltips without shortcuts
+        link.set_status(
+            name_tooltip="Just the name",
+            run_tooltip="Just run",
+            stop_tooltip="Just stop",
+            append_shortcuts=False,
+        )
 
-            # Verify tooltips have no shortcuts
-            assert link._name_widget.tooltip == "Just the name"
-            assert link._custom_run_tooltip == "Just run"
-            assert link._custom_stop_tooltip == "Just stop"
+        # Verify tooltips have no shortcuts
+        assert link._name_widget.tooltip == "Just the name"
+        assert link._custom_run_tooltip == "Just run"
+        assert link._custom_stop_tooltip == "Just stop"
 
-    async def test_set_name_tooltip(self):
+    async def test_set_name_tooltip(self, mount_link):
         """Test set_name_tooltip() updates name widget tooltip."""
         link = CommandLink("TestCommand")
-        app = CommandLinkTestApp(link)
+        await mount_link(link)
 
-        async with app.run_test() as pilot:
-            # Set custom tooltip with shortcuts (default)
-            link.set_name_tooltip("Build the project")
-            await pilot.pause()
+        # Set custom tooltip with shortcuts (default)
+        link.set_name_tooltip("Build the project")
 
-            # Should have custom tooltip with shortcuts appended
-            assert "Build the project" in link._name_widget.tooltip
-            assert "Play/Stop" in link._name_widget.tooltip
+        # Should have custom tooltip with shortcuts appended
+        assert "Build the project" in link._name_widget.tooltip
+        assert "Play/Stop" in link._name_widget.tooltip
 
-            # Set custom tooltip without shortcuts
-            link.set_name_tooltip("Just the project", append_shortcuts=False)
-            await pilot.pause()
+        # Set custom tooltip without shortcuts
+        link.set_name_tooltip("Just the project", append_shortcuts=False)
 
-            assert link._name_widget.tooltip == "Just the project"
-            assert "Play/Stop" not in link._name_widget.tooltip
+        assert link._name_widget.tooltip == "Just the project"
+        assert "Play/Stop" not in link._name_widget.tooltip
 
-            # Set to None should use command name
-            link.set_name_tooltip(None)
-            await pilot.pause()
+        # Set to None should use command name
+        link.set_name_tooltip(None)
 
-            assert "TestCommand" in link._name_widget.tooltip
+        assert "TestCommand" in link._name_widget.tooltip
 
-    async def test_set_play_stop_tooltips(self):
+    async def test_set_play_stop_tooltips(self, mount_link):
         """Test set_play_stop_tooltips() updates play/stop button tooltips."""
         link = CommandLink("TestCommand")
-        app = CommandLinkTestApp(link)
+        await mount_link(link)
 
-        async with app.run_test() as pilot:
-            # Set custom tooltips with shortcuts (default)
-            link.set_play_stop_tooltips(run_tooltip="Start build", stop_tooltip="Cancel build")
-            await pilot.pause()
+        # Set custom tooltips with shortcuts (default)
+        link.set_play_stop_tooltips(run_tooltip="Start build", stop_tooltip="Cancel build")
 
-            # Initially not running, should show run tooltip with shortcuts
-            assert link._play_stop_widget.tooltip == "Start build (space/p)"
+        # Initially not running, should show run tooltip with shortcuts
+        assert link._play_stop_widget.tooltip == "Start build (space/p)"
 
-            # Change to running, should show stop tooltip with shortcuts
-            link.set_status(running=True)
-            await pilot.pause()
-            assert link._play_stop_widget.tooltip == "Cancel build (space/p)"
+        # Change to running, should show stop tooltip with shortcuts
+        link.set_status(running=True)
+        assert link._play_stop_widget.tooltip == "Cancel build (space/p)"
 
-            # Set custom tooltips without shortcuts
-            link.set_play_stop_tooltips(run_tooltip="Just start", stop_tooltip="Just stop", append_shortcuts=False)
-            await pilot.pause()
+        # Set custom tooltips without shortcuts
+        link.set_play_stop_tooltips(run_tooltip="Just start", stop_tooltip="Just stop", append_shortcuts=False)
 
-            # Should show tooltips without shortcuts
-            assert link._play_stop_widget.tooltip == "Just stop"
+        # Should show tooltips without shortcuts
+        assert link._play_stop_widget.tooltip == "Just stop"
 
-            # Change back to not running
-            link.set_status(running=False)
-            await pilot.pause()
-            assert link._play_stop_widget.tooltip == "Just start"
+        # Change back to not running
+        link.set_status(running=False)
+        assert link._play_stop_widget.tooltip == "Just start"
 
-    async def test_set_settings_tooltip(self):
+    async def test_set_settings_tooltip(self, mount_link):
         """Test set_settings_tooltip() updates settings icon tooltip."""
         link = CommandLink("TestCommand", show_settings=True)
-        app = CommandLinkTestApp(link)
+        await mount_link(link)
 
-        async with app.run_test() as pilot:
-            # Set custom tooltip with shortcuts (default)
-            link.set_settings_tooltip("Configure build options")
-            await pilot.pause()
+        # Set custom tooltip with shortcuts (default)
+        link.set_settings_tooltip("Configure build options")
 
-            assert link._settings_widget.tooltip == "Configure build options (s)"
+        assert link._settings_widget.tooltip == "Configure build options (s)"
 
-            # Set custom tooltip without shortcuts
-            link.set_settings_tooltip("Just build options", append_shortcuts=False)
-            await pilot.pause()
+        # Set custom tooltip without shortcuts
+        link.set_settings_tooltip("Just build options", append_shortcuts=False)
 
-            assert link._settings_widget.tooltip == "Just build options"
+        assert link._settings_widget.tooltip == "Just build options"
 
-            # Set to None should use default
-            link.set_settings_tooltip(None)
-            await pilot.pause()
+        # Set to None should use default
+        link.set_settings_tooltip(None)
+
+        assert link._settings_widget.tooltip == "Settings (s)"
 
-            assert link._settings_widget.tooltip == "Settings (s)"
+    async def test_default_tooltips_show_custom_keys(self, mount_link):
+        """Test default play/stop and settings tooltips list the configured keys."""
+        link = CommandLink("TestCommand", show_settings=True, play_stop_keys=["r"], settings_keys=["c"])
+        await mount_link(link)
 
+        assert link._play_stop_widget.tooltip == "Run command (r)"
+        assert link._settings_widget.tooltip == "Settings (c)"
 
+        link.set_status(running=True)
+        assert link._play_stop_widget.tooltip == "Stop command (r)"
+
+
+@pytest.mark.usefixtures("no_spinner_timer")
 class TestCommandLinkPlayStop:
     """Test suite for CommandLink play/stop functionality."""
 
-    async def test_play_button_click_posts_event(self):
+    def test_play_button_click_posts_event(self):
         """Test play/stop action works correctly."""
         link = CommandLink("TestCommand")
 
@@ -365,124 +394,92 @@ class TestCommandLinkPlayStop:
         # message posting in Textual tests, so we just verify action works)
         assert link.is_running is False  # State unchanged by action alone
 
-    async def test_stop_button_click_posts_event(self):
+    async def test_stop_button_click_posts_event(self, mount_link):
         """Test clicking stop button posts StopClicked event."""
         link = CommandLink("TestCommand")
-        app = CommandLinkTestApp(link)
-
-        async with app.run_test() as pilot:
-            # Set running
-            link.set_status(running=True)
-            await pilot.pause()
-
-            # Click stop button
-            await pilot.click(".play-stop-button")
-            await pilot.pause()
+        pilot = await mount_link(link)
+        app = pilot.app
 
-            assert len(app.stop_clicked_events) == 1
-            event = app.stop_clicked_events[0]
-            assert event.name == "TestCommand"
+        # Set running
+        link.set_status(running=True)
+        await pilot.pause()
 
-    async def test_play_keyboard_shortcut_space(self):
-        """Test space key is bound for play/stop action."""
-        link = CommandLink("TestCommand")
-        app = CommandLinkTestApp(link)
+        # Click stop button
+        await pilot.click(link._play_stop_widget)
 
-        async with app.run_test():
-            # Verify binding exists
-            bindings = link._bindings.get_bindings_for_key("space")
-            assert len(bindings) > 0
-            assert bindings[0].action == "play_stop"
+        assert len(app.stop_clicked_events) == 1
+        event = app.stop_clicked_events[0]
+        assert event.name == "TestCommand"
 
-    async def test_play_keyboard_shortcut_p(self):
-        """Test 'p' key is bound for play/stop action."""
+    async def test_clicking_other_children_posts_no_play_stop_event(self, mount_link):
+        """Test only the play/stop button itself posts PlayClicked/StopClicked."""
         link = CommandLink("TestCommand")
-        app = CommandLinkTestApp(link)
+        pilot = await mount_link(link)
+        app = pilot.app
 
-        async with app.run_test():
-            # Verify binding exists
-            bindings = link._bindings.get_bindings_for_key("p")
-            assert len(bindings) > 0
-            assert bindings[0].action == "play_stop"
-
-    async def test_custom_play_stop_keys(self):
-        """Test custom play_stop_keys parameter creates bindings."""
-        link = CommandLink("TestCommand", play_stop_keys=["r", "t"])
-        app = CommandLinkTestApp(link)
+        await pilot.click(link._status_widget)
+        await pilot.click(link._name_widget)
 
-        async with app.run_test():
-            # Verify custom bindings exist
-            bindings_r = link._bindings.get_bindings_for_key("r")
-            assert len(bindings_r) > 0
-            assert bindings_r[0].action == "play_stop"
+        assert app.play_clicked_events == []
+        assert app.stop_clicked_events == []
 
-            bindings_t = link._bindings.get_bindings_for_key("t")
-            assert len(bindings_t) > 0
-            assert bindings_t[0].action == "play_stop"
+        await pilot.click(link._play_stop_widget)
+        assert len(app.play_clicked_events) == 1
 
 
 class TestCommandLinkOutput:
     """Test suite for CommandLink output file handling."""
 
-    async def test_output_clicked_posted_when_name_clicked(self, temp_output_file):
+    async def test_output_clicked_posted_when_name_clicked(self, mount_link, temp_output_file):
         """Test OutputClicked is posted when FileLink name is clicked."""
         link = CommandLink("TestCommand", output_path=temp_output_file)
-        app = CommandLinkTestApp(link)
+        pilot = await mount_link(link)
+        app = pilot.app
 
-        async with app.run_test() as pilot:
-            # Click on the FileLink name widget
-            await pilot.click(FileLink)
-            await pilot.pause()
+        # Click on the FileLink name widget
+        await pilot.click(link._name_widget)
 
-            assert len(app.output_clicked_events) == 1
-            event = app.output_clicked_events[0]
-            assert event.output_path == temp_output_file
+        assert len(app.output_clicked_events) == 1
+        event = app.output_clicked_events[0]
+        assert event.output_path == temp_output_file
 
-    async def test_open_output_keyboard_shortcut(self, temp_output_file):
-        """Test 'o' key opens output file."""
+    async def test_open_output_action_posts_output_clicked(self, mount_link, temp_output_file):
+        """Test the open_output action opens the output file and posts OutputClicked."""
         link = CommandLink("TestCommand", output_path=temp_output_file)
-        app = CommandLinkTestApp(link)
+        pilot = await mount_link(link)
 
-        async with app.run_test() as pilot:
-            link.focus()
-            await pilot.press("o")
-            await pilot.pause()
+        await link.run_action("open_output")
+        await pilot.pause()
 
-            # Should trigger FileLink open action
-            # (no easy way to verify file opening in test, just verify no crash)
+        assert len(pilot.app.output_clicked_events) == 1
+        assert pilot.app.output_clicked_events[0].output_path == temp_output_file
 
-    async def test_custom_open_keys(self, temp_output_file):
-        """Test custom open_keys parameter."""
-        link = CommandLink("TestCommand", output_path=temp_output_file, open_keys=["f", "enter"])
-        app = CommandLinkTestApp(link)
+    def test_open_output_action_before_mount_is_noop(self, temp_output_file):
+        """Test the open_output action does nothing before the link's children are composed."""
+        link = CommandLink("TestCommand", output_path=temp_output_file)
 
-        async with app.run_test() as pilot:
-            link.focus()
+        link.action_open_output()  # Should not raise
 
-            # Custom key 'f' should work
-            await pilot.press("f")
-            await pilot.pause()
-            # (no easy way to verify file opening in test)
+        assert link._children_built is False
 
-    async def test_set_output_path(self, temp_output_file):
+    async def test_set_output_path(self, mount_link, temp_output_file):
         """Test set_output_path() updates the output path."""
         link = CommandLink("TestCommand")
-        app = CommandLinkTestApp(link)
+        pilot = await mount_link(link)
 
-        async with app.run_test() as pilot:
-            # Initially no output path
-            assert link.output_path is None
-            assert link._name_widget.__class__.__name__ == "Static"
+        # Initially no output path
+        assert link.output_path is None
+        assert type(link._name_widget) is Static
 
-            # Set output path
-            link.set_output_path(temp_output_file)
-            await pilot.pause()
+        # Set output path
+        link.set_output_path(temp_output_file)
+        await pilot.pause()
 
-            assert link.output_path == temp_output_file
-            # Name widget should now be FileLink
-            assert isinstance(link._name_widget, FileLink)
+        assert link.output_path == temp_output_file
+        # Name widget should now be FileLink
+        assert isinstance(link._name_widget, FileLink)
 
-    async def test_set_output_path_filelink_to_filelink(self, tmp_path):
+    async def test_set_output_path_filelink_to_filelink(self, mount_link, tmp_path):
         """Test set_output_path() updates FileLink when path changes (PRIMARY BUG FIX)."""
         # Create two temp files
         temp_file1 = tmp_path / "output1.txt"
@@ -492,194 +489,229 @@ class TestCommandLinkOutput:
 
         # Initialize with first output path
         link = CommandLink("TestCommand", output_path=temp_file1)
-        app = CommandLinkTestApp(link)
+        pilot = await mount_link(link)
 
-        async with app.run_test() as pilot:
-            # Should start with FileLink pointing to temp_file1
-            assert link.output_path == temp_file1
-            assert isinstance(link._name_widget, FileLink)
-            assert link._name_widget.path == temp_file1
+        # Should start with FileLink pointing to temp_file1
+        assert link.output_path == temp_file1
+        assert isinstance(link._name_widget, FileLink)
+        assert link._name_widget.path == temp_file1
 
-            # Update to new output path
-            link.set_output_path(temp_file2)
-            await pilot.pause()
+        # Update to new output path
+        link.set_output_path(temp_file2)
+        await pilot.pause()
+
+        # Should still be FileLink but with updated path
+        assert link.output_path == temp_file2
+        assert isinstance(link._name_widget, FileLink)
+        assert link._name_widget.path == temp_file2.resolve()
 
-            # Should still be FileLink but with updated path
-            assert link.output_path == temp_file2
-            assert isinstance(link._name_widget, FileLink)
-            assert link._name_widget.path == temp_file2.resolve()
+    async def test_set_output_path_same_path_is_noop(self, mount_link, temp_output_file):
+        """Test setting the current output path again leaves the name widget untouched."""
+        link = CommandLink("TestCommand", output_path=temp_output_file)
+        await mount_link(link)
 
-    async def test_set_output_path_filelink_to_static(self, temp_output_file):
+        name_widget = link._name_widget
+
+        set_path = patch.object(FileLink, "set_path")
+        build_tooltip = patch.object(link, "_build_tooltip_with_shortcuts")
+        with set_path as mock_set_path, build_tooltip as mock_build:
+            link.set_output_path(link.output_path)
+            link.set_output_path(str(temp_output_file))
+
+        mock_set_path.assert_not_called()
+        mock_build.assert_not_called()
+        assert link._name_widget is name_widget
+
+    async def test_set_output_path_filelink_to_static(self, mount_link, temp_output_file):
         """Test set_output_path(None) converts FileLink back to Static."""
         # Initialize with output path
         link = CommandLink("TestCommand", output_path=temp_output_file)
-        app = CommandLinkTestApp(link)
+        pilot = await mount_link(link)
 
-        async with app.run_test() as pilot:
-            # Should start with FileLink
-            assert link.output_path == temp_output_file
-            assert isinstance(link._name_widget, FileLink)
+        # Should start with FileLink
+        assert link.output_path == temp_output_file
+        assert isinstance(link._name_widget, FileLink)
 
-            # Clear output path
-            link.set_output_path(None)
-            await pilot.pause()
+        # Clear output path
+        link.set_output_path(None)
+        await pilot.pause()
 
-            # Should be converted to Static
-            assert link.output_path is None
-            assert link._name_widget.__class__.__name__ == "Static"
-            assert not isinstance(link._name_widget, FileLink)
+        # Should be converted to Static
+        assert link.output_path is None
+        assert type(link._name_widget) is Static
+        assert not isinstance(link._name_widget, FileLink)
 
-    async def test_set_output_path_static_to_filelink(self, temp_output_file):
+    async def test_set_output_path_static_to_filelink(self, mount_link, temp_output_file):
         """Test set_output_path() converts Static to FileLink (existing behavior)."""
         # This is the existing test scenario, included for completeness
         link = CommandLink("TestCommand")
-        app = CommandLinkTestApp(link)
+        pilot = await mount_link(link)
 
-        async with app.run_test() as pilot:
-            # Should start with Static
-            assert link.output_path is None
-            assert link._name_widget.__class__.__name__ == "Static"
+        # Should start with Static
+        assert link.output_path is None
+        assert type(link._name_widget) is Static
 
-            # Set output path
-            link.set_output_path(temp_output_file)
-            await pilot.pause()
+        # Set output path
+        link.set_output_path(temp_output_file)
+        await pilot.pause()
 
-            # Should be converted to FileLink
-            assert link.output_path == temp_output_file
-            assert isinstance(link._name_widget, FileLink)
+        # Should be converted to FileLink
+        assert link.output_path == temp_output_file
+        assert isinstance(link._name_widget, FileLink)
 
 
 class TestCommandLinkSettings:
     """Test suite for CommandLink settings functionality."""
 
-    async def test_settings_icon_click_posts_event(self):
-        """Test settings binding is created when show_settings=True."""
+    async def test_settings_icon_click_posts_settings_clicked(self, mount_link):
+        """Test clicking the settings icon posts SettingsClicked."""
         link = CommandLink("TestCommand", show_settings=True)
-        app = CommandLinkTestApp(link)
+        pilot = await mount_link(link)
 
-        async with app.run_test():
-            # Verify settings binding exists
-            bindings = link._bindings.get_bindings_for_key("s")
-            assert len(bindings) > 0
-            assert bindings[0].action == "settings"
+        await pilot.click(link._settings_widget)
 
-            # Verify settings widget is visible
-            settings = link.query_one(".settings-icon")
-            assert settings is not None
+        assert len(pilot.app.settings_clicked_events) == 1
+        assert pilot.app.settings_clicked_events[0].name == "TestCommand"
 
-    async def test_settings_keyboard_shortcut(self):
-        """Test 's' key triggers settings action."""
-        link = CommandLink("TestCommand", show_settings=True)
-        app = CommandLinkTestApp(link)
+    async def test_settings_widget_absent_when_disabled(self, mount_link):
+        """Test no settings widget exists and the action is a no-op without show_settings."""
+        link = CommandLink("TestCommand")
+        pilot = await mount_link(link)
 
-        async with app.run_test() as pilot:
-            link.focus()
-            await pilot.press("s")
-            await pilot.pause()
+        assert link._settings_widget is None
 
-            assert len(app.settings_clicked_events) == 1
+        link.action_settings()
+        await pilot.pause()
 
-    async def test_custom_settings_keys(self):
-        """Test custom settings_keys parameter."""
-        link = CommandLink("TestCommand", show_settings=True, settings_keys=["c", "comma"])
-        app = CommandLinkTestApp(link)
+        assert len(pilot.app.settings_clicked_events) == 0
 
-        async with app.run_test() as pilot:
-            link.focus()
+    async def test_settings_action_posts_settings_clicked(self, mount_link):
+        """Test the settings action posts SettingsClicked (key routing is covered by test_all_keyboard_shortcuts)."""
+        link = CommandLink("TestCommand", show_settings=True)
+        pilot = await mount_link(link)
 
-            # Custom key 'c' should work
-            await pilot.press("c")
-            await pilot.pause()
-            assert len(app.settings_clicked_events) == 1
+        await link.run_action("settings")
+        await pilot.pause()
 
+        assert len(pilot.app.settings_clicked_events) == 1
 
+
+@pytest.mark.usefixtures("no_spinner_timer")
 class TestCommandLinkProperties:
     """Test suite for CommandLink properties."""
 
-    def test_command_name_property(self):
-        """Test command_name property returns command name."""
-        link = CommandLink("My Test Command")
-
-        assert link.command_name == "My Test Command"
-
-    def test_output_path_property(self, temp_output_file):
-        """Test output_path property."""
-        link = CommandLink("TestCommand", output_path=temp_output_file)
-
-        assert link.output_path == temp_output_file
-
-    async def test_is_running_property(self):
+    def test_messages_use_slots(self, temp_output_file):
+        """Test CommandLink messages store their payload in slots, without a __dict__."""
+        link = CommandLink("TestCommand")
+        messages = [
+            CommandLink.PlayClicked(link, "TestCommand", None),
+            CommandLink.StopClicked(link, "TestCommand", None),
+            CommandLink.SettingsClicked(link, "TestCommand", None),
+            CommandLink.OutputClicked(temp_output_file),
+        ]
+
+        for message in messages:
+            assert not hasattr(message, "__dict__")
+        assert messages[0].widget is link
+        assert messages[3].output_path == temp_output_file
+
+    async def test_is_running_property(self, mount_link):
         """Test is_running property."""
         link = CommandLink("TestCommand")
-        app = CommandLinkTestApp(link)
+        await mount_link(link)
 
-        async with app.run_test() as pilot:
-            assert link.is_running is False
+        assert link.is_running is False
 
-            link.set_status(running=True)
-            await pilot.pause()
-            assert link.is_running is True
+        # set_status() updates running state synchronously; no pause needed
+        link.set_status(running=True)
+        assert link.is_running is True
 
-            link.set_status(running=False)
-            await pilot.pause()
-            assert link.is_running is False
+        link.set_status(running=False)
+        assert link.is_running is False
 
 
 class TestCommandLinkKeyboardBindings:
     """Test suite for CommandLink keyboard binding creation."""
 
-    async def test_runtime_bindings_created(self, temp_output_file):
-        """Test runtime bindings are created in on_mount()."""
+    async def test_all_default_bindings(self, mount_link, temp_output_file):
+        """Test every default key is bound to its action once the link is mounted."""
         link = CommandLink("TestCommand", output_path=temp_output_file, show_settings=True)
-        app = CommandLinkTestApp(link)
-
-        async with app.run_test():
-            # Check open_output bindings
-            bindings_o = link._bindings.get_bindings_for_key("o")
-            assert len(bindings_o) > 0
-            assert bindings_o[0].action == "open_output"
-
-            # Check play_stop bindings
-            bindings_space = link._bindings.get_bindings_for_key("space")
-            assert len(bindings_space) > 0
-            assert bindings_space[0].action == "play_stop"
-
-            bindings_p = link._bindings.get_bindings_for_key("p")
-            assert len(bindings_p) > 0
-            assert bindings_p[0].action == "play_stop"
-
-            # Check settings bindings
-            bindings_s = link._bindings.get_bindings_for_key("s")
-            assert len(bindings_s) > 0
-            assert bindings_s[0].action == "settings"
-
-    async def test_custom_bindings_created(self, temp_output_file):
-        """Test custom keyboard bindings are created correctly."""
+        await mount_link(link)
+
+        for key, action in [
+            ("enter", "open_output"),
+            ("o", "open_output"),
+            ("space", "play_stop"),
+            ("p", "play_stop"),
+            ("s", "settings"),
+        ]:
+            bindings = link._bindings.get_bindings_for_key(key)
+            assert bindings[0].action == action, key
+
+    async def test_custom_bindings_created(self, mount_link, temp_output_file):
+        """Test custom open, play/stop and settings keys are bound and trigger their actions."""
         link = CommandLink(
             "TestCommand",
             output_path=temp_output_file,
             show_settings=True,
             open_keys=["f1", "f2"],
-            play_stop_keys=["r"],
-            settings_keys=["c"],
+            play_stop_keys=["r", "t"],
+            settings_keys=["c", "comma"],
         )
-        app = CommandLinkTestApp(link)
+        pilot = await mount_link(link)
+        app = pilot.app
+
+        for key, action in [
+            ("f1", "open_output"),
+            ("f2", "open_output"),
+            ("r", "play_stop"),
+            ("t", "play_stop"),
+            ("c", "settings"),
+            ("comma", "settings"),
+        ]:
+            bindings = link._bindings.get_bindings_for_key(key)
+            assert bindings[0].action == action, key
+
+        # One custom key per action, end to end
+        link.focus()
+        await pilot.press("r", "c", "f1")
+        await pilot.pause()
+
+        assert len(app.play_clicked_events) == 1
+        assert len(app.settings_clicked_events) == 1
+        assert len(app.output_clicked_events) == 1
+
+    async def test_bindings_not_shared_between_instances(self, temp_output_file):
+        """Test default keys aren't rebound per instance and custom keys stay per instance."""
+        default_link = CommandLink("Default", output_path=temp_output_file)
+        custom_link = CommandLink("Custom", output_path=temp_output_file, open_keys=["o", "f"])
+        app = CommandLinkTestApp(Vertical(default_link, custom_link))
 
         async with app.run_test():
-            # Check custom open_keys
-            bindings_f1 = link._bindings.get_bindings_for_key("f1")
-            assert len(bindings_f1) > 0
-            assert bindings_f1[0].action == "open_output"
+            assert len(default_link._bindings.get_bindings_for_key("o")) == 1
+            assert len(custom_link._bindings.get_bindings_for_key("o")) == 2
+            assert "f" not in default_link._bindings.key_to_bindings
+            assert len(CommandLink._merged_bindings.get_bindings_for_key("o")) == 1
+
+    def test_shortcuts_string_cached_per_key_shape(self, temp_output_file):
+        """Test links with the same key configuration share one shortcuts string."""
+        link1 = CommandLink("First", output_path=temp_output_file, show_settings=True)
+        link2 = CommandLink("Second", output_path=temp_output_file, show_settings=True)
+        custom = CommandLink("Custom", play_stop_keys=["r"], show_settings=False)
 
-            # Check custom play_stop_keys
-            bindings_r = link._bindings.get_bindings_for_key("r")
-            assert len(bindings_r) > 0
-            assert bindings_r[0].action == "play_stop"
+        assert link1._get_shortcuts_string() == "Open output (enter/o), Play/Stop (space/p), Settings (s)"
+        assert link1._get_shortcuts_string() is link2._get_shortcuts_string()
+        assert custom._get_shortcuts_string() == "Play/Stop (r)"
 
-            # Check custom settings_keys
-            bindings_c = link._bindings.get_bindings_for_key("c")
-            assert len(bindings_c) > 0
-            assert bindings_c[0].action == "settings"
+    def test_default_tooltips_shared_between_links(self):
+        """Test links with the same keys share their default control tooltip strings."""
+        link1 = CommandLink("First", show_settings=True)
+        link2 = CommandLink("Second", show_settings=True)
+
+        assert link1._default_run_tooltip == "Run command (space/p)"
+        assert link1._default_run_tooltip is link2._default_run_tooltip
+        assert link1._default_stop_tooltip is link2._default_stop_tooltip
+        assert link1._settings_widget.tooltip is link2._settings_widget.tooltip
 
 
 class TestCommandLinkIntegration:
@@ -692,26 +724,24 @@ class TestCommandLinkIntegration:
 
         async with app.run_test() as pilot:
             # 1. Click play using keyboard shortcut (more reliable)
+            # (press() waits for each key to be handled, so no pause is needed in between)
             link.focus()
             await pilot.press("space")
-            await pilot.pause()
-            assert len(app.play_clicked_events) == 1
 
             # 2. Set running status
             link.set_status(running=True, tooltip="Running...")
-            await pilot.pause()
             assert link.is_running is True
 
             # 3. Press space to stop
             await pilot.press("space")
             await pilot.pause()
+            assert len(app.play_clicked_events) == 1
             assert len(app.stop_clicked_events) == 1
 
             # 4. Set completed status
             link.set_status(icon="✅", running=False, tooltip="Completed")
-            await pilot.pause()
             assert link.is_running is False
-            assert "✅" in str(link._status_widget.render())
+            assert link._status_widget.content == "✅"
 
     async def test_all_keyboard_shortcuts(self, temp_output_file):
         """Test all keyboard shortcuts work together."""
@@ -721,20 +751,13 @@ class TestCommandLinkIntegration:
         async with app.run_test() as pilot:
             link.focus()
 
-            # Play/stop with space
-            await pilot.press("space")
+            # Play/stop with space, settings with 's', open output with 'o'
+            await pilot.press("space", "s", "o")
             await pilot.pause()
-            assert len(app.play_clicked_events) == 1
 
-            # Settings with 's'
-            await pilot.press("s")
-            await pilot.pause()
+            assert len(app.play_clicked_events) == 1
             assert len(app.settings_clicked_events) == 1
-
-            # Open output with 'o'
-            await pilot.press("o")
-            await pilot.pause()
-            # (FileLink opens, no direct way to verify in test)
+            assert len(app.output_clicked_events) == 1
 
     async def test_commandlink_custom_spinner_frames(self):
         """Test CommandLink accepts custom spinner frames."""
@@ -742,418 +765,472 @@ class TestCommandLinkIntegration:
         link = CommandLink("Build", spinner_frames=custom_frames)
         app = CommandLinkTestApp(link)
 
-        async with app.run_test() as pilot:
+        async with app.run_test():
             assert link._spinner_frames == custom_frames
 
             # Set to running and verify spinner uses custom frames
             link.set_status(running=True)
-            await pilot.pause()
 
             # Spinner should cycle through custom frames
             # (status widget will show one of the custom frames)
             assert link._command_running is True
 
-    async def test_commandlink_custom_spinner_interval(self):
-        """Test CommandLink accepts custom spinner interval."""
-        link = CommandLink("Build", spinner_interval=0.05)
+    async def test_spinner_ticks_skip_layout_for_uniform_frames(self):
+        """Test only the first spinner frame triggers layout when frames share a width."""
+        link = CommandLink("Build")
         app = CommandLinkTestApp(link)
 
         async with app.run_test():
-            assert link._spinner_interval == 0.05
+            link.set_status(running=True)
+            CommandLink._spinner_timers[link._spinner_key].pause()
 
-    async def test_commandlink_default_spinner_frames(self):
-        """Test CommandLink uses default spinner frames when not specified."""
+            with patch.object(link._status_widget, "update") as mock_update:
+                link._animate_spinner()
+                link._animate_spinner()
+                link._animate_spinner()
+
+            layouts = [call.kwargs["layout"] for call in mock_update.call_args_list]
+            assert layouts == [True, False, False]
+
+    async def test_spinner_ticks_keep_layout_for_mixed_width_frames(self):
+        """Test every spinner frame triggers layout when frame widths differ."""
+        link = CommandLink("Build", spinner_frames=[".", "..", "..."])
+        app = CommandLinkTestApp(link)
+
+        async with app.run_test():
+            link.set_status(running=True)
+            CommandLink._spinner_timers[link._spinner_key].pause()
+
+            with patch.object(link._status_widget, "update") as mock_update:
+                link._animate_spinner()
+                link._animate_spinner()
+
+            layouts = [call.kwargs["layout"] for call in mock_update.call_args_list]
+            assert layouts == [True, True]
+
+    async def test_spinner_relayouts_after_mid_run_icon_change(self):
+        """Test a spinner tick after set_status(icon=...) mid-run resizes the status widget to the frame."""
         link = CommandLink("Build")
         app = CommandLinkTestApp(link)
 
+        async with app.run_test() as pilot:
+            link.set_status(running=True)
+            CommandLink._spinner_timers[link._spinner_key].pause()
+            link._animate_spinner()
+            link._animate_spinner()
+
+            # A wider icon while running lays the widget out at the icon's width
+            link.set_status(icon="✅✅")
+            await pilot.pause()
+            assert link._status_widget.size.width == 4
+
+            link._animate_spinner()
+            await pilot.pause()
+            assert link._status_widget.size.width == 1
+
+    async def test_running_links_share_one_spinner_timer(self):
+        """Test running links with the same interval share a single spinner timer."""
+        link1 = CommandLink("Build")
+        link2 = CommandLink("Test")
+        app = CommandLinkTestApp(Vertical(link1, link2))
+
         async with app.run_test():
-            assert link._spinner_frames == CommandLink.DEFAULT_SPINNER_FRAMES
+            link1.set_status(running=True)
+            link2.set_status(running=True)
 
-    async def test_commandlink_default_spinner_interval(self):
-        """Test CommandLink uses default spinner interval when not specified."""
+            assert link1._spinner_key == link2._spinner_key
+            assert len(CommandLink._spinner_timers) == 1
+            assert CommandLink._spinner_groups[link1._spinner_key] == {link1, link2}
+
+            link1.set_status(running=False)
+            assert CommandLink._spinner_groups[link2._spinner_key] == {link2}
+
+            link2.set_status(running=False)
+            assert not CommandLink._spinner_timers
+            assert not CommandLink._spinner_groups
+
+    async def test_spinner_started_before_mount_joins_group_on_mount(self):
+        """Test set_status(running=True) before mounting starts the spinner once mounted."""
+        link = CommandLink("Build")
+        link.set_status(running=True)
+        assert link._spinner_key is None
+
+        app = CommandLinkTestApp(link)
+        async with app.run_test():
+            assert link._spinner_key in CommandLink._spinner_timers
+
+    async def test_spinner_group_released_on_unmount(self):
+        """Test a running link leaves the shared spinner group when the app exits."""
         link = CommandLink("Build")
         app = CommandLinkTestApp(link)
 
         async with app.run_test():
-            assert link._spinner_interval == 0.1
-            assert link._spinner_interval == CommandLink.DEFAULT_SPINNER_INTERVAL
+            link.set_status(running=True)
+            assert CommandLink._spinner_timers
+
+        assert not CommandLink._spinner_timers
+        assert not CommandLink._spinner_groups
+
+    async def test_spinner_timer_animates_status_widget(self, monkeypatch):
+        """Test the shared spinner timer drives frames onto the status widget."""
+        ticked = asyncio.Event()
+        animate_spinner = CommandLink._animate_spinner
+
+        def animate_and_signal(link):
+            animate_spinner(link)
+            ticked.set()
+
+        monkeypatch.setattr(CommandLink, "_animate_spinner", animate_and_signal)
+        link = CommandLink("Build", spinner_frames=["a", "b"], spinner_interval=0.01)
+        app = CommandLinkTestApp(link)
+
+        async with app.run_test():
+            link.set_status(running=True)
+            # Wait for the first tick itself rather than pausing and hoping it has happened
+            await asyncio.wait_for(ticked.wait(), timeout=1.0)
+
+            assert link._status_widget.content in ("a", "b")
+
+    async def test_spinner_frames_cycle_and_restart_from_first(self):
+        """Test spinner frames wrap around and restart from the first frame."""
+        link = CommandLink("Build", spinner_frames=["a", "b"])
+        app = CommandLinkTestApp(link)
+
+        async with app.run_test():
+            link.set_status(running=True)
+            CommandLink._spinner_timers[link._spinner_key].pause()
+
+            with patch.object(link._status_widget, "update") as mock_update:
+                link._animate_spinner()
+                link._animate_spinner()
+                link._animate_spinner()
+                link.set_status(running=False)
+                link.set_status(running=True)
+                CommandLink._spinner_timers[link._spinner_key].pause()
+                link._animate_spinner()
+
+            frames = [call.args[0] for call in mock_update.call_args_list if call.args[0] in ("a", "b")]
+            assert frames == ["a", "b", "a", "a"]
+
+    def test_commandlink_custom_spinner_interval(self):
+        """Test CommandLink accepts custom spinner interval."""
+        link = CommandLink("Build", spinner_interval=0.05)
+
+        assert link._spinner_interval == 0.05
+
+    def test_commandlink_default_spinner_frames(self):
+        """Test CommandLink uses default spinner frames when not specified."""
+        link = CommandLink("Build")
+
+        assert link._spinner_frames == CommandLink.DEFAULT_SPINNER_FRAMES
+
+    def test_commandlink_default_spinner_interval(self):
+        """Test CommandLink uses default spinner interval when not specified."""
+        link = CommandLink("Build")
+
+        assert link._spinner_interval == 0.1
+        assert link._spinner_interval == CommandLink.DEFAULT_SPINNER_INTERVAL
 
 
+@pytest.mark.usefixtures("no_spinner_timer")
 class TestCommandLinkTimer:
     """Test suite for CommandLink timer functionality."""
 
-    async def test_timer_disabled_by_default(self):
+    def test_timer_disabled_by_default(self):
         """Test timer is disabled by default."""
         link = CommandLink("TestCommand")
-        app = CommandLinkTestApp(link)
 
-        async with app.run_test():
-            assert link._show_timer is False
-            # Timer widget should not be created
-            timer_widgets = link.query(".timer-display")
-            assert len(timer_widgets) == 0
+        assert link._show_timer is False
+        # Timer widget should not be created
+        assert count_composed(link, "timer-display") == 0
 
-    async def test_timer_enabled_with_show_timer(self):
+    def test_timer_enabled_with_show_timer(self):
         """Test timer widget is created when show_timer=True."""
         link = CommandLink("TestCommand", show_timer=True)
-        app = CommandLinkTestApp(link)
 
-        async with app.run_test():
-            assert link._show_timer is True
-            # Timer widget should be created
-            timer_widgets = link.query(".timer-display")
-            assert len(timer_widgets) == 1
+        assert link._show_timer is True
+        # Timer widget should be created
+        assert count_composed(link, "timer-display") == 1
 
-    async def test_timer_field_width_default(self):
+    def test_timer_field_width_default(self):
         """Test timer field width defaults to 12."""
         link = CommandLink("TestCommand", show_timer=True)
-        app = CommandLinkTestApp(link)
 
-        async with app.run_test():
-            assert link._timer_field_width == 12
+        assert link._timer_field_width == 12
 
-    async def test_timer_field_width_custom(self):
+    def test_timer_field_width_custom(self):
         """Test custom timer field width."""
         link = CommandLink("TestCommand", show_timer=True, timer_field_width=20)
-        app = CommandLinkTestApp(link)
 
-        async with app.run_test():
-            assert link._timer_field_width == 20
+        assert link._timer_field_width == 20
 
-    async def test_set_start_time(self):
+    async def test_set_start_time(self, mount_link):
         """Test set_start_time() updates start timestamp."""
-        from unittest.mock import patch
-
         link = CommandLink("TestCommand", show_timer=True)
-        app = CommandLinkTestApp(link)
+        await mount_link(link)
 
-        async with app.run_test() as pilot:
-            # Set running with start time
-            link.set_status(running=True)
+        # Set running with start time
+        link.set_status(running=True)
 
-            with patch("time.time", return_value=1000.0):
-                link.set_start_time(1000.0)
-                await pilot.pause()
+        with patch("time.time", return_value=1000.0):
+            link.set_start_time(1000.0)
 
-                assert link._start_time == 1000.0
-                # Should show "0ms" (just started, 0 seconds = 0ms)
-                assert "0ms" in str(link._timer_widget.render())
+            assert link._start_time == 1000.0
+            # Should show "0ms" (just started, 0 seconds = 0ms)
+            assert "0ms" in link._timer_widget.content
 
-    async def test_set_end_time(self):
+    async def test_set_end_time(self, mount_link):
         """Test set_end_time() updates end timestamp."""
-        from unittest.mock import patch
-
         link = CommandLink("TestCommand", show_timer=True)
-        app = CommandLinkTestApp(link)
+        await mount_link(link)
 
-        async with app.run_test() as pilot:
-            # Set not running with end time
-            link.set_status(running=False)
+        # Set not running with end time
+        link.set_status(running=False)
 
-            with patch("time.time", return_value=1000.0):
-                link.set_end_time(1000.0)
-                await pilot.pause()
+        with patch("time.time", return_value=1000.0):
+            link.set_end_time(1000.0)
 
-                assert link._end_time == 1000.0
-                # Should show "0s ago" (just ended)
-                assert "0s ago" in str(link._timer_widget.render())
+            assert link._end_time == 1000.0
+            # Should show "0s ago" (just ended)
+            assert "0s ago" in link._timer_widget.content
 
-    async def test_timer_shows_duration_when_running(self):
+    async def test_timer_shows_duration_when_running(self, mount_link):
         """Test timer shows duration when command is running."""
-        from unittest.mock import patch
-
         link = CommandLink("TestCommand", show_timer=True)
-        app = CommandLinkTestApp(link)
+        await mount_link(link)
 
-        async with app.run_test() as pilot:
-            # Set both start_time and end_time
-            link.set_start_time(1000.0)
-            link.set_end_time(900.0)
+        # Set both start_time and end_time
+        link.set_start_time(1000.0)
+        link.set_end_time(900.0)
 
-            # When running, should show duration from start_time
-            link.set_status(running=True)
+        # When running, should show duration from start_time
+        link.set_status(running=True)
 
-            with patch("time.time", return_value=1135.0):
-                link._update_timer_display()
-                await pilot.pause()
+        with patch("time.time", return_value=1135.0):
+            link._update_timer_display()
 
-                rendered = str(link._timer_widget.render())
-                # 135 seconds elapsed = 2m 15s
-                assert "2m 15s" in rendered
+            display = link._timer_widget.content
+            # 135 seconds elapsed = 2m 15s
+            assert "2m 15s" in display
 
-    async def test_timer_shows_time_ago_when_not_running(self):
+    async def test_timer_shows_time_ago_when_not_running(self, mount_link):
         """Test timer shows time-ago when command is not running."""
-        from unittest.mock import patch
-
         link = CommandLink("TestCommand", show_timer=True)
-        app = CommandLinkTestApp(link)
+        await mount_link(link)
 
-        async with app.run_test() as pilot:
-            # Set both start_time and end_time
-            link.set_start_time(1000.0)
-            link.set_end_time(900.0)
+        # Set both start_time and end_time
+        link.set_start_time(1000.0)
+        link.set_end_time(900.0)
 
-            # When not running, should show time ago from end_time
-            link.set_status(running=False)
+        # When not running, should show time ago from end_time
+        link.set_status(running=False)
 
-            with patch("time.time", return_value=4500.0):
-                link._update_timer_display()
-                await pilot.pause()
+        with patch("time.time", return_value=4500.0):
+            link._update_timer_display()
 
-                rendered = str(link._timer_widget.render())
-                # 3600 seconds elapsed = 1h ago
-                assert "1h ago" in rendered
+            display = link._timer_widget.content
+            # 3600 seconds elapsed = 1h ago
+            assert "1h ago" in display
 
-    async def test_timer_padding_correct(self):
+    async def test_timer_padding_correct(self, mount_link):
         """Test timer values are right-justified within field width."""
-        from unittest.mock import patch
-
         link = CommandLink("TestCommand", show_timer=True, timer_field_width=12)
-        app = CommandLinkTestApp(link)
+        pilot = await mount_link(link)
 
-        async with app.run_test() as pilot:
-            # Short duration should be padded
-            link.set_status(running=True)
+        # Short duration should be padded
+        link.set_status(running=True)
 
-            with patch("time.time", return_value=1005.0):
-                link.set_start_time(1000.0)
-                link._update_timer_display()
-                await pilot.pause()
+        with patch("time.time", return_value=1005.0):
+            link.set_start_time(1000.0)
+            link._update_timer_display()
+            await pilot.pause()
 
-                # 5 seconds elapsed = "5.0s", should be right-justified to 12 chars
-                assert link._last_timer_display == "5.0s".rjust(12)
+            # 5 seconds elapsed = "5.0s", should be right-justified to 12 chars
+            assert link._last_timer_display == "5.0s".rjust(12)
 
-    async def test_timer_empty_when_no_data(self):
+    async def test_timer_empty_when_no_data(self, mount_link):
         """Test timer is empty when no data is set."""
         link = CommandLink("TestCommand", show_timer=True)
-        app = CommandLinkTestApp(link)
+        pilot = await mount_link(link)
 
-        async with app.run_test() as pilot:
-            link.set_status(running=False)
-            await pilot.pause()
+        link.set_status(running=False)
+        await pilot.pause()
 
-            # Should be empty (all spaces) when no data
-            assert link._last_timer_display == "".rjust(12)
+        # Should be empty (all spaces) when no data
+        assert link._last_timer_display == "".rjust(12)
 
-    async def test_timer_interval_started_on_mount(self):
+    async def test_timer_interval_started_on_mount(self, mount_link):
         """Test timer update interval is started when widget is mounted."""
         link = CommandLink("TestCommand", show_timer=True)
-        app = CommandLinkTestApp(link)
+        await mount_link(link)
 
-        async with app.run_test():
-            # Timer interval should be created
-            assert link._timer_update_interval is not None
+        # Timer interval should be created
+        assert link._timer_update_interval is not None
 
-    async def test_timer_interval_not_started_when_disabled(self):
+    async def test_timer_interval_not_started_when_disabled(self, mount_link):
         """Test timer interval is not started when show_timer=False."""
         link = CommandLink("TestCommand", show_timer=False)
-        app = CommandLinkTestApp(link)
+        await mount_link(link)
 
-        async with app.run_test():
-            # Timer interval should not be created
-            assert link._timer_update_interval is None
-
-    async def test_timer_updates_automatically(self):
-        """Test timer display updates automatically via interval."""
-        import time as time_module
-        from unittest.mock import patch
+        # Timer interval should not be created
+        assert link._timer_update_interval is None
 
+    async def test_timer_updates_automatically(self, mount_link):
+        """Test the timer interval callback advances the elapsed display."""
         link = CommandLink("TestCommand", show_timer=True)
-        app = CommandLinkTestApp(link)
+        await mount_link(link)
 
-        async with app.run_test() as pilot:
-            link.set_status(running=True)
+        link.set_status(running=True, start_time=1000.0)
+        assert link._timer_update_interval is not None
 
-            # Mock time progression
-            mock_times = [1000.0, 1001.0, 1002.0]
-            time_index = [0]
+        # Call the interval's callback directly instead of waiting a real second for it to fire
+        with patch("time.time", return_value=1001.0):
+            link._update_timer_display()
+        first_display = link._last_timer_display
+        with patch("time.time", return_value=1002.0):
+            link._update_timer_display()
 
-            def mock_time():
-                result = mock_times[min(time_index[0], len(mock_times) - 1)]
-                time_index[0] += 1
-                return result
+        assert first_display.strip() == "1.0s"
+        assert link._last_timer_display.strip() == "2.0s"
+        assert len(link._last_timer_display) == 12  # Padded to field width
 
-            with patch.object(time_module, "time", side_effect=mock_time):
-                link.set_start_time(1000.0)
-                await pilot.pause()
-
-                # Wait for interval to fire (updates should show time progression)
-                await pilot.pause(1.5)
-
-                # Display should have updated (time advanced from 1.0s to 2.0s)
-                # Note: This might not always differ due to timing, so we just verify it's still a valid display
-                assert len(link._last_timer_display) == 12  # Padded to field width
-
-    async def test_clear_timestamps(self):
+    async def test_clear_timestamps(self, mount_link):
         """Test clearing timer timestamps with None."""
         link = CommandLink("TestCommand", show_timer=True)
-        app = CommandLinkTestApp(link)
+        pilot = await mount_link(link)
 
-        async with app.run_test() as pilot:
-            # Set timestamps
-            link.set_start_time(1000.0)
-            link.set_end_time(900.0)
-            await pilot.pause()
+        # Set timestamps
+        link.set_start_time(1000.0)
+        link.set_end_time(900.0)
+        await pilot.pause()
 
-            assert link._start_time == 1000.0
-            assert link._end_time == 900.0
+        assert link._start_time == 1000.0
+        assert link._end_time == 900.0
 
-            # Clear timestamps
-            link.set_start_time(None)
-            link.set_end_time(None)
-            await pilot.pause()
+        # Clear timestamps
+        link.set_start_time(None)
+        link.set_end_time(None)
+        await pilot.pause()
 
-            assert link._start_time is None
-            assert link._end_time is None
+        assert link._start_time is None
+        assert link._end_time is None
 
-    async def test_timer_layout_order(self):
+    async def test_timer_layout_order(self, mount_link):
         """Test timer appears in correct position in layout."""
         link = CommandLink("TestCommand", show_timer=True, show_settings=True)
-        app = CommandLinkTestApp(link)
+        await mount_link(link)
 
-        async with app.run_test():
-            # Get all children
-            children = list(link.children)
+        # Get all children
+        children = list(link.children)
 
-            # Order should be: status, timer, play/stop, name, settings
-            assert children[0] == link._status_widget
-            assert children[1] == link._timer_widget
-            assert children[2] == link._play_stop_widget
-            assert children[3] == link._name_widget
-            assert children[4] == link._settings_widget
+        # Order should be: status, timer, play/stop, name, settings
+        assert children[0] == link._status_widget
+        assert children[1] == link._timer_widget
+        assert children[2] == link._play_stop_widget
+        assert children[3] == link._name_widget
+        assert children[4] == link._settings_widget
 
-    async def test_timer_elapsed_duration_computation(self):
+    async def test_timer_elapsed_duration_computation(self, mount_link):
         """Test timer computes elapsed duration from start_time."""
-        from unittest.mock import patch
-
         link = CommandLink("TestCommand", show_timer=True)
-        app = CommandLinkTestApp(link)
+        await mount_link(link)
 
-        async with app.run_test() as pilot:
-            link.set_status(running=True)
+        link.set_status(running=True)
 
-            with patch("time.time", return_value=1065.0):
-                link.set_start_time(1000.0)
-                link._update_timer_display()
-                await pilot.pause()
+        with patch("time.time", return_value=1065.0):
+            link.set_start_time(1000.0)
+            link._update_timer_display()
 
-                # 65 seconds elapsed = 1m 5s
-                assert "1m 5s" in str(link._timer_widget.render())
+            # 65 seconds elapsed = 1m 5s
+            assert "1m 5s" in link._timer_widget.content
 
-    async def test_timer_time_ago_computation(self):
+    async def test_timer_time_ago_computation(self, mount_link):
         """Test timer computes time-ago from end_time."""
-        from unittest.mock import patch
-
         link = CommandLink("TestCommand", show_timer=True)
-        app = CommandLinkTestApp(link)
+        await mount_link(link)
 
-        async with app.run_test() as pilot:
-            link.set_status(running=False)
+        link.set_status(running=False)
 
-            with patch("time.time", return_value=1300.0):
-                link.set_end_time(1000.0)
-                link._update_timer_display()
-                await pilot.pause()
+        with patch("time.time", return_value=1300.0):
+            link.set_end_time(1000.0)
+            link._update_timer_display()
 
-                # 300 seconds elapsed = 5m ago
-                assert "5m ago" in str(link._timer_widget.render())
+            # 300 seconds elapsed = 5m ago
+            assert "5m ago" in link._timer_widget.content
 
-    async def test_timer_handles_clock_skew(self):
+    async def test_timer_handles_clock_skew(self, mount_link):
         """Test timer handles negative elapsed time (clock skew)."""
-        from unittest.mock import patch
-
         link = CommandLink("TestCommand", show_timer=True)
-        app = CommandLinkTestApp(link)
+        await mount_link(link)
 
-        async with app.run_test() as pilot:
-            link.set_status(running=True)
+        link.set_status(running=True)
 
-            # Set start_time in the future (clock skew)
-            with patch("time.time", return_value=1000.0):
-                link.set_start_time(2000.0)
-                link._update_timer_display()
-                await pilot.pause()
+        # Set start_time in the future (clock skew)
+        with patch("time.time", return_value=1000.0):
+            link.set_start_time(2000.0)
+            link._update_timer_display()
 
-                # Should show empty string for negative elapsed
-                rendered = str(link._timer_widget.render())
-                # The display should be padded spaces (empty)
-                assert rendered.strip() == ""
+            # Should show empty string for negative elapsed
+            display = link._timer_widget.content
+            # The display should be padded spaces (empty)
+            assert display.strip() == ""
 
-    async def test_timer_constructor_with_timestamps(self):
+    def test_timer_constructor_with_timestamps(self):
         """Test CommandLink constructor accepts start_time and end_time."""
-        from unittest.mock import patch
+        link = CommandLink("TestCommand", show_timer=True, start_time=1000.0, end_time=900.0)
 
-        with patch("time.time", return_value=1060.0):
-            link = CommandLink("TestCommand", show_timer=True, start_time=1000.0, end_time=900.0)
-            app = CommandLinkTestApp(link)
+        assert link._start_time == 1000.0
+        assert link._end_time == 900.0
 
-            async with app.run_test():
-                assert link._start_time == 1000.0
-                assert link._end_time == 900.0
-
-    async def test_set_status_with_start_time(self):
+    async def test_set_status_with_start_time(self, mount_link):
         """Test set_status() with start_time parameter."""
-        from unittest.mock import patch
-
         link = CommandLink("TestCommand", show_timer=True)
-        app = CommandLinkTestApp(link)
+        pilot = await mount_link(link)
 
-        async with app.run_test() as pilot:
-            with patch("time.time", return_value=1000.0):
-                link.set_status(running=True, start_time=1000.0)
-                await pilot.pause()
+        with patch("time.time", return_value=1000.0):
+            link.set_status(running=True, start_time=1000.0)
+            await pilot.pause()
 
-                assert link._start_time == 1000.0
-                assert link._command_running is True
+            assert link._start_time == 1000.0
+            assert link._command_running is True
 
-    async def test_set_status_with_end_time(self):
+    async def test_set_status_with_end_time(self, mount_link):
         """Test set_status() with end_time parameter."""
-        from unittest.mock import patch
-
         link = CommandLink("TestCommand", show_timer=True)
-        app = CommandLinkTestApp(link)
+        pilot = await mount_link(link)
 
-        async with app.run_test() as pilot:
-            with patch("time.time", return_value=1000.0):
-                link.set_status(running=False, end_time=1000.0, icon="✅")
-                await pilot.pause()
+        with patch("time.time", return_value=1000.0):
+            link.set_status(running=False, end_time=1000.0, icon="✅")
+            await pilot.pause()
 
-                assert link._end_time == 1000.0
-                assert link._command_running is False
-                assert link._status_icon == "✅"
+            assert link._end_time == 1000.0
+            assert link._command_running is False
+            assert link._status_icon == "✅"
 
-    async def test_timer_milliseconds_display(self):
+    async def test_timer_milliseconds_display(self, mount_link):
         """Test timer displays milliseconds for sub-second durations."""
-        from unittest.mock import patch
-
         link = CommandLink("TestCommand", show_timer=True)
-        app = CommandLinkTestApp(link)
+        await mount_link(link)
 
-        async with app.run_test() as pilot:
-            link.set_status(running=True)
+        link.set_status(running=True)
 
-            with patch("time.time", return_value=1000.5):
-                link.set_start_time(1000.0)
-                link._update_timer_display()
-                await pilot.pause()
+        with patch("time.time", return_value=1000.5):
+            link.set_start_time(1000.0)
+            link._update_timer_display()
 
-                # 0.5 seconds elapsed = 500ms
-                assert "500ms" in str(link._timer_widget.render())
+            # 0.5 seconds elapsed = 500ms
+            assert "500ms" in link._timer_widget.content
 
-    async def test_timer_decimal_seconds_display(self):
+    async def test_timer_decimal_seconds_display(self, mount_link):
         """Test timer displays decimal seconds for 1-60s range."""
-        from unittest.mock import patch
-
         link = CommandLink("TestCommand", show_timer=True)
-        app = CommandLinkTestApp(link)
+        await mount_link(link)
 
-        async with app.run_test() as pilot:
-            link.set_status(running=True)
+        link.set_status(running=True)
 
-            with patch("time.time", return_value=1030.5):
-                link.set_start_time(1000.0)
-                link._update_timer_display()
-                await pilot.pause()
+        with patch("time.time", return_value=1030.5):
+            link.set_start_time(1000.0)
+            link._update_timer_display()
 
-                # 30.5 seconds elapsed = 30.5s
-                assert "30.5s" in str(link._timer_widget.render())
+            # 30.5 seconds elapsed = 30.5s
+            assert "30.5s" in link._timer_widget.content
@@ -335,17 +335,17 @@ class TestCommandLinkTemplateIntegration:
 
         assert cmd._command_template == "vim {{ line_plus }} {{ path }}"
 
-    def test_forwards_to_filelink_in_init(self, tmp_path):
-        """Test that command_template is forwarded to FileLink when created in __init__."""
+    def test_forwards_to_filelink_name_widget(self, tmp_path):
+        """Test that command_template is forwarded to the FileLink name widget."""
         output_file = tmp_path / "output.txt"
         output_file.write_text("output")
 
         cmd = CommandLink("Test Command", output_path=output_file, command_template="custom {{ path }}")
 
         # Check that internal FileLink has the template
-        assert hasattr(cmd, "_name_widget")
-        if isinstance(cmd._name_widget, FileLink):
-            assert cmd._name_widget._command_template == "custom {{ path }}"
+        name_widget = cmd._create_name_widget()
+        assert isinstance(name_widget, FileLink)
+        assert name_widget._command_template == "custom {{ path }}"
 
 
 class TestFileLinkTemplateProperty:
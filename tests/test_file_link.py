@@ -9,6 +9,9 @@ from textual.app import App, ComposeResult
 from textual_filelink import FileLink
 from textual_filelink.utils import sanitize_id
 
+# Command builders only format the path; it never needs to exist
+BUILDER_PATH = Path("/project/test.txt")
+
 
 class FileLinkTestApp(App):
     """Test app for FileLink."""
@@ -25,18 +28,10 @@ class FileLinkTestApp(App):
         self.opened_events.append(event)
 
 
-@pytest.fixture
-def temp_file(tmp_path):
-    """Create a temporary file for testing."""
-    test_file = tmp_path / "test.txt"
-    test_file.write_text("test content")
-    return test_file
-
-
 class TestFileLink:
     """Test suite for FileLink widget."""
 
-    async def test_filelink_initialization(self, temp_file):
+    def test_filelink_initialization(self, temp_file):
         """Test FileLink initializes with correct properties."""
         link = FileLink(temp_file, line=10, column=5)
 
@@ -44,13 +39,12 @@ class TestFileLink:
         assert link.line == 10
         assert link.column == 5
 
-    async def test_filelink_displays_filename(self, temp_file, get_rendered_text):
+    def test_filelink_displays_filename(self, temp_file):
         """Test FileLink displays only the filename, not full path."""
         link = FileLink(temp_file)
 
-        async with FileLinkTestApp(link).run_test():
-            # The Static widget should display just the filename
-            assert get_rendered_text(link) == temp_file.name
+        # The Static widget's content is just the filename
+        assert link.content == temp_file.name
 
     async def test_filelink_click_posts_message(self, temp_file):
         """Test clicking FileLink posts an Opened message."""
@@ -58,8 +52,7 @@ class TestFileLink:
         app = FileLinkTestApp(link)
 
         async with app.run_test() as pilot:
-            await pilot.click(FileLink)
-            await pilot.pause()
+            await pilot.click(link)
 
             assert len(app.opened_events) == 1
             event = app.opened_events[0]
@@ -73,8 +66,7 @@ class TestFileLink:
         app = FileLinkTestApp(link)
 
         async with app.run_test() as pilot:
-            await pilot.click(FileLink)
-            await pilot.pause()
+            await pilot.click(link)
 
             assert len(app.opened_events) == 1
             event = app.opened_events[0]
@@ -82,21 +74,22 @@ class TestFileLink:
             assert event.line is None
             assert event.column is None
 
-    async def test_filelink_with_string_path(self, temp_file):
+    def test_filelink_with_string_path(self, temp_file):
         """Test FileLink accepts string paths."""
         link = FileLink(str(temp_file))
 
         assert link.path == temp_file.resolve()
 
-    async def test_filelink_resolves_path(self, tmp_path):
+    def test_filelink_resolves_path(self, tmp_path):
         """Test FileLink resolves relative paths."""
         relative_path = Path("./test.txt")
         link = FileLink(relative_path)
 
         # Path should be resolved to absolute
         assert link.path.is_absolute()
+        assert link.path == Path.cwd() / "test.txt"
 
-    async def test_filelink_custom_command_builder(self, temp_file):
+    def test_filelink_custom_command_builder(self, temp_file):
         """Test FileLink with custom command builder."""
 
         def custom_builder(path, line, column):
@@ -107,58 +100,41 @@ class TestFileLink:
         # Command builder should be stored
         assert link._command_builder == custom_builder
 
-    async def test_filelink_vscode_command_builder(self, temp_file):
-        """Test VSCode command builder generates correct command."""
-        cmd = FileLink.vscode_command(temp_file, 10, 5)
-
-        assert cmd[0] == "code"
-        assert cmd[1] == "--goto"
-        assert "10" in cmd[2]
-        assert "5" in cmd[2]
-
-    async def test_filelink_vscode_command_without_position(self, temp_file):
-        """Test VSCode command builder without line/column."""
-        cmd = FileLink.vscode_command(temp_file, None, None)
-
-        assert cmd[0] == "code"
-        assert cmd[1] == "--goto"
-        assert cmd[2] == str(temp_file)
-
-    async def test_filelink_vim_command_builder(self, temp_file):
-        """Test vim command builder generates correct command."""
-        cmd = FileLink.vim_command(temp_file, 10, 5)
-
-        assert cmd[0] == "vim"
-        assert "+call cursor(10,5)" in cmd
-        assert str(temp_file) in cmd
-
-    async def test_filelink_nano_command_builder(self, temp_file):
-        """Test nano command builder generates correct command."""
-        cmd = FileLink.nano_command(temp_file, 10, 5)
-
-        assert cmd[0] == "nano"
-        assert "+10,5" in cmd
-        assert str(temp_file) in cmd
-
-    async def test_filelink_eclipse_command_builder(self, temp_file):
-        """Test Eclipse command builder generates correct command."""
-        cmd = FileLink.eclipse_command(temp_file, 10, None)
-
-        assert cmd[0] == "eclipse"
-        assert "--launcher.openFile" in cmd
-        assert any(str(temp_file) in arg for arg in cmd)
+    @pytest.mark.parametrize(
+        "builder,line,column,expected",
+        [
+            (FileLink.vscode_command, 10, 5, ["code", "--goto", f"{BUILDER_PATH}:10:5"]),
+            (FileLink.vscode_command, None, None, ["code", "--goto", str(BUILDER_PATH)]),
+            (FileLink.vim_command, 10, 5, ["vim", "+call cursor(10,5)", str(BUILDER_PATH)]),
+            (FileLink.vim_command, 10, None, ["vim", "+10", str(BUILDER_PATH)]),
+            (FileLink.nano_command, 10, 5, ["nano", "+10,5", str(BUILDER_PATH)]),
+            (FileLink.nano_command, 10, None, ["nano", "+10", str(BUILDER_PATH)]),
+            (FileLink.eclipse_command, 10, None, ["eclipse", "--launcher.openFile", f"{BUILDER_PATH}:10"]),
+            (FileLink.eclipse_command, None, None, ["eclipse", "--launcher.openFile", str(BUILDER_PATH)]),
+        ],
+        ids=[
+            "vscode",
+            "vscode-no-position",
+            "vim",
+            "vim-line-only",
+            "nano",
+            "nano-line-only",
+            "eclipse-line-only",
+            "eclipse-no-position",
+        ],
+    )
+    def test_filelink_command_builder(self, builder, line, column, expected):
+        """Test each built-in editor command builder generates the exact command."""
+        assert builder(BUILDER_PATH, line, column) == expected
 
-    async def test_filelink_copy_path_command_builder(self, temp_file):
-        """Test copy path command builder."""
-        cmd = FileLink.copy_path_command(temp_file, 10, 5)
+    def test_filelink_copy_path_command_includes_position(self):
+        """Test copy path command builder copies the path with line and column."""
+        # The clipboard program varies by platform; the copied text does not
+        full_cmd = " ".join(FileLink.copy_path_command(BUILDER_PATH, 10, 5))
 
-        # Should contain the path with line and column
-        full_cmd = " ".join(cmd)
-        assert str(temp_file) in full_cmd
-        assert "10" in full_cmd
-        assert "5" in full_cmd
+        assert f"{BUILDER_PATH}:10:5" in full_cmd
 
-    async def test_filelink_default_command_builder_class_level(self, temp_file):
+    def test_filelink_default_command_builder_class_level(self, temp_file):
         """Test setting default command builder at class level."""
         original = FileLink.default_command_builder
 
@@ -174,7 +150,7 @@ class TestFileLink:
             # Restore original
             FileLink.default_command_builder = original
 
-    async def test_filelink_properties_readonly(self, temp_file):
+    def test_filelink_properties_readonly(self, temp_file):
         """Test FileLink properties are read-only."""
         link = FileLink(temp_file, line=10, column=5)
 
@@ -245,9 +221,8 @@ class TestFileLink:
 
         link = FileLink(symlink_file)
 
-        # FileLink resolves symlinks, so path may point to target or symlink
-        # Just verify it doesn't crash and path is set
-        assert link.path is not None
+        # The path is made absolute without following the symlink
+        assert link.path == symlink_file
 
         app = FileLinkTestApp(link)
         async with app.run_test():
@@ -286,8 +261,7 @@ class TestFileLink:
         async with app.run_test() as pilot:
             with patch("subprocess.run") as mock_run:
                 mock_run.side_effect = subprocess.TimeoutExpired(cmd=["sleep", "999"], timeout=1)
-                await pilot.click(FileLink)
-                await pilot.pause()
+                await pilot.click(link)
 
                 # Should handle timeout gracefully (not crash)
                 assert True  # If we get here, app didn't crash
@@ -304,8 +278,7 @@ class TestFileLink:
         async with app.run_test() as pilot:
             with patch("subprocess.run") as mock_run:
                 mock_run.return_value = MagicMock(returncode=1, stderr="Command failed")
-                await pilot.click(FileLink)
-                await pilot.pause()
+                await pilot.click(link)
 
                 # Should handle failure gracefully (not crash)
                 assert True  # If we get here, app didn't crash
@@ -322,8 +295,7 @@ class TestFileLink:
         async with app.run_test() as pilot:
             with patch("subprocess.run") as mock_run:
                 mock_run.side_effect = OSError("Command not found")
-                await pilot.click(FileLink)
-                await pilot.pause()
+                await pilot.click(link)
 
                 # Should handle exception gracefully (not crash)
                 assert True  # If we get here, app didn't crash
@@ -353,41 +325,9 @@ class TestFileLink:
         assert len(cmd) > 0
         assert any(str(temp_file) in arg for arg in cmd)
 
-    async def test_vim_command_with_line_only(self, temp_file):
-        """Test vim command builder with only line (no column)."""
-        cmd = FileLink.vim_command(temp_file, 10, None)
-
-        assert cmd[0] == "vim"
-        assert "+10" in cmd
-        assert str(temp_file) in cmd
-
-    async def test_nano_command_with_line_only(self, temp_file):
-        """Test nano command builder with only line (no column)."""
-        cmd = FileLink.nano_command(temp_file, 10, None)
-
-        assert cmd[0] == "nano"
-        assert "+10" in cmd
-        assert str(temp_file) in cmd
-
-    async def test_eclipse_command_with_line_only(self, temp_file):
-        """Test eclipse command builder with line but no column."""
-        cmd = FileLink.eclipse_command(temp_file, 10, None)
-
-        assert cmd[0] == "eclipse"
-        assert "--launcher.openFile" in cmd
-        assert f"{temp_file}:10" in " ".join(cmd)
-
-    async def test_eclipse_command_without_position(self, temp_file):
-        """Test eclipse command builder without line/column."""
-        cmd = FileLink.eclipse_command(temp_file, None, None)
-
-        assert cmd[0] == "eclipse"
-        assert "--launcher.openFile" in cmd
-        assert str(temp_file) in " ".join(cmd)
-
     # === Keyboard Accessibility Tests ===
 
-    async def test_filelink_can_focus(self, temp_file):
+    def test_filelink_can_focus(self, temp_file):
         """Test that FileLink is focusable."""
         link = FileLink(temp_file)
 
@@ -448,7 +388,7 @@ class TestFileLink:
             # Verify notification was shown (indicating file opening was attempted)
             # We can't easily verify the subprocess call, but the notification indicates success
 
-    async def test_filelink_embedded_not_focusable(self, temp_file):
+    def test_filelink_embedded_not_focusable(self, temp_file):
         """Test FileLink with _embedded=True is not focusable."""
         link = FileLink(temp_file, _embedded=True)
         assert link.can_focus is False
@@ -470,17 +410,16 @@ class TestFileLink:
 
         async with app.run_test():
             assert link.display_name == "Custom Display Name"
+            # Other display tests read the Static's content directly; render once here
             assert get_rendered_text(link) == "Custom Display Name"
             assert link.path == temp_file  # Path should still be the actual file
 
-    async def test_filelink_display_name_defaults_to_filename(self, temp_file, get_rendered_text):
+    def test_filelink_display_name_defaults_to_filename(self, temp_file):
         """Test FileLink display_name defaults to filename."""
         link = FileLink(temp_file)
-        app = FileLinkTestApp(link)
 
-        async with app.run_test():
-            assert link.display_name == temp_file.name
-            assert get_rendered_text(link) == temp_file.name
+        assert link.display_name == temp_file.name
+        assert link.content == temp_file.name
 
     # Note: Custom open_keys feature is complex to implement with Textual's binding system
     # Skipping these tests for now - feature is present but not fully working
@@ -539,7 +478,7 @@ class TestFileLink:
             link.set_path(temp_file2)
             assert link.path == temp_file2.resolve()
 
-    async def test_set_path_updates_display(self, temp_file, tmp_path, get_rendered_text):
+    async def test_set_path_updates_display(self, temp_file, tmp_path):
         """Test set_path() updates the display text."""
         link = FileLink(temp_file)
         app = FileLinkTestApp(link)
@@ -549,12 +488,12 @@ class TestFileLink:
         temp_file2.write_text("output content")
 
         async with app.run_test():
-            assert get_rendered_text(link) == temp_file.name
+            assert link.content == temp_file.name
 
             # Update to new path
             link.set_path(temp_file2)
             await link.workers.wait_for_complete()
-            assert get_rendered_text(link) == temp_file2.name
+            assert link.content == temp_file2.name
 
     async def test_set_path_updates_tooltip(self, temp_file, tmp_path):
         """Test set_path() updates the tooltip."""
@@ -573,7 +512,7 @@ class TestFileLink:
             assert temp_file2.name in str(link.tooltip)
             assert temp_file.name not in str(link.tooltip)
 
-    async def test_set_path_with_display_name(self, temp_file, tmp_path, get_rendered_text):
+    async def test_set_path_with_display_name(self, temp_file, tmp_path):
         """Test set_path() with custom display name."""
         link = FileLink(temp_file)
         app = FileLinkTestApp(link)
@@ -589,7 +528,7 @@ class TestFileLink:
 
             assert link.path == temp_file2.resolve()
             assert link.display_name == "Custom Name"
-            assert get_rendered_text(link) == "Custom Name"
+            assert link.content == "Custom Name"
 
     async def test_set_path_updates_line_column(self, temp_file):
         """Test set_path() updates line and column."""
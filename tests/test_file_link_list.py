@@ -2,9 +2,12 @@
 """Tests for FileLinkList widget (v0.4.0)."""
 
 import pytest
+import pytest_asyncio
 from textual.app import App, ComposeResult
+from textual.containers import Vertical
 
 from textual_filelink import CommandLink, FileLink, FileLinkList, FileLinkWithIcons, Icon
+from textual_filelink.file_link_list import FileLinkListItem
 
 
 class FileLinkListTestApp(App):
@@ -14,6 +17,9 @@ class FileLinkListTestApp(App):
         super().__init__()
         self.widget = widget
         self.item_toggled_events = []
+        self.items_toggled_events = []
+        self.items_cleared_events = []
+        self.items_removed_events = []
         self.item_removed_events = []
 
     def compose(self) -> ComposeResult:
@@ -22,48 +28,39 @@ class FileLinkListTestApp(App):
     def on_file_link_list_item_toggled(self, event: FileLinkList.ItemToggled):
         self.item_toggled_events.append(event)
 
+    def on_file_link_list_items_toggled(self, event: FileLinkList.ItemsToggled):
+        self.items_toggled_events.append(event)
+
     def on_file_link_list_item_removed(self, event: FileLinkList.ItemRemoved):
         self.item_removed_events.append(event)
 
+    def on_file_link_list_items_removed(self, event: FileLinkList.ItemsRemoved):
+        self.items_removed_events.append(event)
 
-@pytest.fixture
-def temp_file(tmp_path):
-    """Create a temporary test file."""
-    file = tmp_path / "test.py"
-    file.write_text("print('test')")
-    return file
+    def on_file_link_list_items_cleared(self, event: FileLinkList.ItemsCleared):
+        self.items_cleared_events.append(event)
 
 
 class TestFileLinkListInitialization:
     """Test suite for FileLinkList initialization."""
 
-    def test_initialization_defaults(self):
-        """Test FileLinkList initializes with default values."""
-        file_list = FileLinkList()
-
-        assert file_list._show_toggles is False
-        assert file_list._show_remove is False
+    @pytest.mark.parametrize(
+        "kwargs,show_toggles,show_remove",
+        [
+            ({}, False, False),
+            ({"show_toggles": True}, True, False),
+            ({"show_remove": True}, False, True),
+            ({"show_toggles": True, "show_remove": True}, True, True),
+        ],
+    )
+    def test_initialization(self, kwargs, show_toggles, show_remove):
+        """Test FileLinkList starts empty with the requested toggle/remove controls."""
+        file_list = FileLinkList(**kwargs)
+
+        assert file_list._show_toggles is show_toggles
+        assert file_list._show_remove is show_remove
         assert len(file_list) == 0
 
-    def test_initialization_with_toggles(self):
-        """Test FileLinkList initializes with toggles enabled."""
-        file_list = FileLinkList(show_toggles=True)
-
-        assert file_list._show_toggles is True
-
-    def test_initialization_with_remove(self):
-        """Test FileLinkList initializes with remove buttons enabled."""
-        file_list = FileLinkList(show_remove=True)
-
-        assert file_list._show_remove is True
-
-    def test_initialization_with_both(self):
-        """Test FileLinkList initializes with both toggles and remove."""
-        file_list = FileLinkList(show_toggles=True, show_remove=True)
-
-        assert file_list._show_toggles is True
-        assert file_list._show_remove is True
-
 
 class TestFileLinkListAddItem:
     """Test suite for adding items to FileLinkList."""
@@ -78,7 +75,7 @@ class TestFileLinkListAddItem:
             file_list.add_item(link)
 
             assert len(file_list) == 1
-            assert link.id in file_list._item_ids
+            assert link.id in file_list._wrappers
             assert link in file_list.get_items()
 
     async def test_add_filelink_with_icons(self, temp_file):
@@ -95,7 +92,7 @@ class TestFileLinkListAddItem:
             file_list.add_item(link)
 
             assert len(file_list) == 1
-            assert link.id in file_list._item_ids
+            assert link.id in file_list._wrappers
 
     async def test_add_commandlink(self):
         """Test adding a CommandLink to the list."""
@@ -107,7 +104,7 @@ class TestFileLinkListAddItem:
             file_list.add_item(cmd)
 
             assert len(file_list) == 1
-            assert cmd.id in file_list._item_ids
+            assert cmd.id in file_list._wrappers
 
     async def test_add_multiple_items(self, temp_file):
         """Test adding multiple items to the list."""
@@ -139,6 +136,22 @@ class TestFileLinkListAddItem:
 
             wrapper = file_list._wrappers["test-py"]
             assert wrapper.is_toggled is True
+            assert wrapper._toggle_icon.content == "☑"
+
+            wrapper.set_toggled(False)
+            assert wrapper._toggle_icon.content == "☐"
+
+    def test_set_toggled_skips_unchanged_state(self, temp_file):
+        """Test set_toggled() with the current state leaves the wrapper untouched."""
+        changes = []
+        link = FileLink(temp_file, id="test-py")
+        wrapper = FileLinkListItem(link, show_toggle=True, initial_toggle=True, on_toggle_change=changes.append)
+
+        wrapper.set_toggled(True)
+        assert changes == []
+
+        wrapper.set_toggled(False)
+        assert changes == [wrapper]
 
     async def test_add_item_without_id_raises(self):
         """Test adding item without ID raises ValueError."""
@@ -185,7 +198,7 @@ class TestFileLinkListRemoveItem:
             file_list.remove_item(link)
 
             assert len(file_list) == 0
-            assert link.id not in file_list._item_ids
+            assert link.id not in file_list._wrappers
 
     async def test_remove_item_posts_message(self, temp_file):
         """Test removing item posts ItemRemoved message."""
@@ -202,6 +215,22 @@ class TestFileLinkListRemoveItem:
             assert len(app.item_removed_events) == 1
             assert app.item_removed_events[0].item == link
 
+    async def test_removed_wrapper_stops_calling_back(self, temp_file):
+        """Test a removed wrapper no longer calls back into the list."""
+        file_list = FileLinkList(show_toggles=True)
+        app = FileLinkListTestApp(file_list)
+
+        async with app.run_test():
+            link = FileLink(temp_file, id="test-py")
+            file_list.add_item(link)
+            wrapper = file_list._wrappers["test-py"]
+
+            file_list.remove_item(link)
+            wrapper.set_toggled(True)
+
+            assert wrapper._on_toggle_change is None
+            assert file_list._toggled_ids == set()
+
     async def test_remove_nonexistent_item(self, temp_file):
         """Test removing non-existent item does nothing."""
         file_list = FileLinkList()
@@ -224,7 +253,7 @@ class TestFileLinkListClearItems:
         file_list = FileLinkList()
         app = FileLinkListTestApp(file_list)
 
-        async with app.run_test():
+        async with app.run_test() as pilot:
             link1 = FileLink(temp_file, id="link1")
             link2 = FileLink(temp_file, id="link2")
             link3 = FileLink(temp_file, id="link3")
@@ -236,20 +265,28 @@ class TestFileLinkListClearItems:
             assert len(file_list) == 3
 
             file_list.clear_items()
+            await pilot.pause()
 
             assert len(file_list) == 0
-            assert len(file_list._item_ids) == 0
             assert len(file_list._wrappers) == 0
+            assert len(file_list.children) == 0
+
+            # Should post a single ItemsCleared message and no ItemRemoved messages
+            assert len(app.items_cleared_events) == 1
+            assert app.items_cleared_events[0].items == [link1, link2, link3]
+            assert len(app.item_removed_events) == 0
 
     async def test_clear_empty_list(self):
         """Test clearing an empty list does nothing."""
         file_list = FileLinkList()
         app = FileLinkListTestApp(file_list)
 
-        async with app.run_test():
+        async with app.run_test() as pilot:
             file_list.clear_items()  # Should not raise
+            await pilot.pause()
 
             assert len(file_list) == 0
+            assert len(app.items_cleared_events) == 0
 
 
 class TestFileLinkListToggleOperations:
@@ -273,8 +310,11 @@ class TestFileLinkListToggleOperations:
             assert file_list._wrappers["link1"].is_toggled is True
             assert file_list._wrappers["link2"].is_toggled is True
 
-            # Should post 2 ItemToggled messages
-            assert len(app.item_toggled_events) == 2
+            # Should post a single batched ItemsToggled message
+            assert len(app.item_toggled_events) == 0
+            assert len(app.items_toggled_events) == 1
+            assert app.items_toggled_events[0].items == [link1, link2]
+            assert app.items_toggled_events[0].is_toggled is True
 
     async def test_toggle_all_false(self, temp_file):
         """Test toggling all items to False."""
@@ -294,6 +334,9 @@ class TestFileLinkListToggleOperations:
             assert file_list._wrappers["link1"].is_toggled is False
             assert file_list._wrappers["link2"].is_toggled is False
 
+            assert len(app.items_toggled_events) == 1
+            assert app.items_toggled_events[0].is_toggled is False
+
     async def test_toggle_all_without_toggles_enabled(self, temp_file):
         """Test toggle_all() does nothing if toggles not enabled."""
         file_list = FileLinkList(show_toggles=False)
@@ -329,6 +372,26 @@ class TestFileLinkListToggleOperations:
             assert link3 in toggled
             assert link2 not in toggled
 
+    async def test_get_toggled_items_tracks_wrapper_changes_in_list_order(self, temp_file):
+        """Test toggled items follow wrapper toggles and come back in list order."""
+        file_list = FileLinkList(show_toggles=True)
+        app = FileLinkListTestApp(file_list)
+
+        async with app.run_test():
+            links = [FileLink(temp_file, id=f"link{i}") for i in range(4)]
+            for link in links:
+                file_list.add_item(link)
+
+            file_list._wrappers["link3"].set_toggled(True)
+            file_list._wrappers["link0"].set_toggled(True)
+            file_list._wrappers["link2"].set_toggled(True)
+            file_list._wrappers["link2"].set_toggled(False)
+
+            assert file_list.get_toggled_items() == [links[0], links[3]]
+
+            file_list.remove_item(links[0])
+            assert file_list.get_toggled_items() == [links[3]]
+
     async def test_get_toggled_items_without_toggles(self, temp_file):
         """Test get_toggled_items() returns empty list if toggles not enabled."""
         file_list = FileLinkList(show_toggles=False)
@@ -364,8 +427,13 @@ class TestFileLinkListToggleOperations:
             assert link1 not in file_list.get_items()
             assert link3 not in file_list.get_items()
 
-            # Should post 2 ItemRemoved messages
-            assert len(app.item_removed_events) == 2
+            assert len(file_list.children) == 1
+            assert file_list.get_toggled_items() == []
+
+            # Should post a single batched ItemsRemoved message
+            assert len(app.item_removed_events) == 0
+            assert len(app.items_removed_events) == 1
+            assert app.items_removed_events[0].items == [link1, link3]
 
     async def test_remove_selected_without_toggles(self, temp_file):
         """Test remove_selected() does nothing if toggles not enabled."""
@@ -443,62 +511,63 @@ class TestFileLinkListIteration:
             assert link2 in items
 
 
+@pytest_asyncio.fixture(scope="class", loop_scope="module")
+async def layout_lists(temp_file):
+    """One running app holding a list per controls combination, each with one added link.
+
+    The layout tests only inspect these lists, so they share the app instead of
+    starting one each.
+    """
+    lists = {
+        "none": FileLinkList(),
+        "toggle": FileLinkList(show_toggles=True),
+        "remove": FileLinkList(show_remove=True),
+        "both": FileLinkList(show_toggles=True, show_remove=True),
+    }
+    app = FileLinkListTestApp(Vertical(*lists.values()))
+    async with app.run_test():
+        for file_list in lists.values():
+            file_list.add_item(FileLink(temp_file, id="test-py"))
+        yield lists
+
+
 class TestFileLinkListWrapperLayout:
     """Test suite for wrapper layout in FileLinkList."""
 
-    async def test_wrapper_without_controls(self, temp_file):
+    def test_wrapper_without_controls(self, layout_lists):
         """Test wrapper layout without toggles or remove."""
-        file_list = FileLinkList()
-        app = FileLinkListTestApp(file_list)
-
-        async with app.run_test():
-            link = FileLink(temp_file, id="test-py")
-            file_list.add_item(link)
+        file_list = layout_lists["none"]
+        link = file_list._wrappers["test-py"]
 
-            wrapper = file_list._wrappers["test-py"]
-            assert wrapper._show_toggle is False
-            assert wrapper._show_remove is False
+        # Without controls the item is mounted directly, with no wrapper
+        assert isinstance(link, FileLink)
+        assert link.parent is file_list
+        assert not file_list.query(FileLinkListItem)
 
-    async def test_wrapper_with_toggle(self, temp_file):
+    def test_wrapper_with_toggle(self, layout_lists):
         """Test wrapper layout with toggle enabled."""
-        file_list = FileLinkList(show_toggles=True)
-        app = FileLinkListTestApp(file_list)
+        wrapper = layout_lists["toggle"]._wrappers["test-py"]
 
-        async with app.run_test():
-            link = FileLink(temp_file, id="test-py")
-            file_list.add_item(link)
-
-            wrapper = file_list._wrappers["test-py"]
-            assert wrapper._show_toggle is True
-            assert hasattr(wrapper, "_toggle_icon")
+        assert wrapper._show_toggle is True
+        assert wrapper._toggle_icon is not None
+        assert wrapper._remove_button is None
 
-    async def test_wrapper_with_remove(self, temp_file):
+    def test_wrapper_with_remove(self, layout_lists):
         """Test wrapper layout with remove button enabled."""
-        file_list = FileLinkList(show_remove=True)
-        app = FileLinkListTestApp(file_list)
-
-        async with app.run_test():
-            link = FileLink(temp_file, id="test-py")
-            file_list.add_item(link)
+        wrapper = layout_lists["remove"]._wrappers["test-py"]
 
-            wrapper = file_list._wrappers["test-py"]
-            assert wrapper._show_remove is True
-            assert hasattr(wrapper, "_remove_button")
+        assert wrapper._show_remove is True
+        assert wrapper._remove_button is not None
+        assert wrapper._toggle_icon is None
 
-    async def test_wrapper_with_both_controls(self, temp_file):
+    def test_wrapper_with_both_controls(self, layout_lists):
         """Test wrapper layout with both toggle and remove."""
-        file_list = FileLinkList(show_toggles=True, show_remove=True)
-        app = FileLinkListTestApp(file_list)
+        wrapper = layout_lists["both"]._wrappers["test-py"]
 
-        async with app.run_test():
-            link = FileLink(temp_file, id="test-py")
-            file_list.add_item(link)
-
-            wrapper = file_list._wrappers["test-py"]
-            assert wrapper._show_toggle is True
-            assert wrapper._show_remove is True
-            assert hasattr(wrapper, "_toggle_icon")
-            assert hasattr(wrapper, "_remove_button")
+        assert wrapper._show_toggle is True
+        assert wrapper._show_remove is True
+        assert wrapper._toggle_icon is not None
+        assert wrapper._remove_button is not None
 
 
 class TestFileLinkListClicks:
@@ -522,7 +591,6 @@ class TestFileLinkListClicks:
 
             # Click the remove button
             await pilot.click(remove_button)
-            await pilot.pause()
 
             # Verify item was removed
             assert len(file_list) == 0
@@ -546,9 +614,48 @@ class TestFileLinkListClicks:
             # Remove second item
             wrapper2 = file_list._wrappers["test-py-2"]
             await pilot.click(wrapper2._remove_button)
-            await pilot.pause()
 
             # Verify one item was removed
             assert len(file_list) == 1
             assert len(app.item_removed_events) == 1
             assert app.item_removed_events[0].item == link2
+
+    async def test_clicking_toggle_icon_posts_item_toggled(self, temp_file):
+        """Test clicking a toggle icon posts ItemToggled for that item only."""
+        file_list = FileLinkList(show_toggles=True, show_remove=True)
+        app = FileLinkListTestApp(file_list)
+
+        async with app.run_test() as pilot:
+            link1 = FileLink(temp_file, id="test-py-1")
+            link2 = FileLink(temp_file, id="test-py-2")
+            file_list.add_item(link1)
+            file_list.add_item(link2)
+            await pilot.pause()
+
+            await pilot.click(file_list._wrappers["test-py-2"]._toggle_icon)
+
+            assert len(app.item_toggled_events) == 1
+            assert app.item_toggled_events[0].item == link2
+            assert app.item_toggled_events[0].is_toggled is True
+            assert file_list.get_toggled_items() == [link2]
+
+    async def test_removed_item_controls_are_unindexed(self, temp_file):
+        """Test removing and clearing items drops their controls from the click indexes."""
+        file_list = FileLinkList(show_toggles=True, show_remove=True)
+        app = FileLinkListTestApp(file_list)
+
+        async with app.run_test():
+            link1 = FileLink(temp_file, id="test-py-1")
+            link2 = FileLink(temp_file, id="test-py-2")
+            file_list.add_item(link1)
+            file_list.add_item(link2)
+            assert len(file_list._toggle_to_wrapper) == 2
+            assert len(file_list._remove_to_wrapper) == 2
+
+            file_list.remove_item(link1)
+            assert len(file_list._toggle_to_wrapper) == 1
+            assert len(file_list._remove_to_wrapper) == 1
+
+            file_list.clear_items()
+            assert not file_list._toggle_to_wrapper
+            assert not file_list._remove_to_wrapper
@@ -28,18 +28,10 @@ class FileLinkWithIconsTestApp(App):
         self.file_opened_events.append(event)
 
 
-@pytest.fixture
-def temp_file(tmp_path):
-    """Create a temporary file for testing."""
-    test_file = tmp_path / "test.txt"
-    test_file.write_text("test content")
-    return test_file
-
-
 class TestFileLinkWithIconsBasic:
     """Basic initialization and property tests."""
 
-    async def test_initialization_minimal(self, temp_file):
+    def test_initialization_minimal(self, temp_file):
         """Test FileLinkWithIcons with minimal parameters."""
         widget = FileLinkWithIcons(temp_file)
 
@@ -47,7 +39,7 @@ class TestFileLinkWithIconsBasic:
         assert widget.line is None
         assert widget.column is None
 
-    async def test_initialization_with_position(self, temp_file):
+    def test_initialization_with_position(self, temp_file):
         """Test FileLinkWithIcons with line/column."""
         widget = FileLinkWithIcons(temp_file, line=10, column=5)
 
@@ -55,20 +47,26 @@ class TestFileLinkWithIconsBasic:
         assert widget.line == 10
         assert widget.column == 5
 
-    async def test_initialization_with_display_name(self, temp_file):
+    def test_initialization_with_display_name(self, temp_file):
         """Test FileLinkWithIcons with custom display name."""
         widget = FileLinkWithIcons(temp_file, display_name="Custom Name")
 
         assert widget.file_link.display_name == "Custom Name"
 
-    async def test_file_link_property(self, temp_file):
+    def test_file_link_property(self, temp_file):
         """Test file_link property returns internal FileLink."""
         widget = FileLinkWithIcons(temp_file)
 
         assert isinstance(widget.file_link, FileLink)
         assert widget.file_link.path == temp_file
 
-    async def test_file_link_is_embedded(self, temp_file):
+    def test_path_resolved_once(self, temp_file):
+        """Test the path is resolved by the internal FileLink and reused, not resolved again."""
+        widget = FileLinkWithIcons(temp_file)
+
+        assert widget.path is widget.file_link.path
+
+    def test_file_link_is_embedded(self, temp_file):
         """Test internal FileLink has can_focus=False (embedded mode)."""
         widget = FileLinkWithIcons(temp_file)
 
@@ -123,7 +121,7 @@ class TestFileLinkWithIconsLayout:
             assert "before1" in widget._icon_widgets
             assert "after1" in widget._icon_widgets
 
-    async def test_icon_ordering_preserved(self, temp_file):
+    def test_icon_ordering_preserved(self, temp_file):
         """Test that icon order in lists is preserved."""
         icons_before = [
             Icon(name="first", icon="1️⃣"),
@@ -131,13 +129,12 @@ class TestFileLinkWithIconsLayout:
             Icon(name="third", icon="3️⃣"),
         ]
         widget = FileLinkWithIcons(temp_file, icons_before=icons_before)
-        app = FileLinkWithIconsTestApp(widget)
 
-        async with app.run_test():
-            # Check that icons exist in our internal tracking
-            assert widget.get_icon("first") is not None
-            assert widget.get_icon("second") is not None
-            assert widget.get_icon("third") is not None
+        # Icons are registered at construction; no app needed
+        assert [icon.name for icon in widget._icons_before] == ["first", "second", "third"]
+        assert widget.get_icon("first") is not None
+        assert widget.get_icon("second") is not None
+        assert widget.get_icon("third") is not None
 
 
 class TestFileLinkWithIconsVisibility:
@@ -191,7 +188,7 @@ class TestFileLinkWithIconsVisibility:
             # Now should be hidden
             assert "icon1" not in widget._icon_widgets
 
-    async def test_set_icon_visible_nonexistent_raises(self, temp_file):
+    def test_set_icon_visible_nonexistent_raises(self, temp_file):
         """Test set_icon_visible raises ValueError for nonexistent icon."""
         widget = FileLinkWithIcons(temp_file)
 
@@ -211,8 +208,7 @@ class TestFileLinkWithIconsClickability:
         async with app.run_test() as pilot:
             # Click the icon widget
             icon_widget = widget._icon_widgets["settings"]
-            await pilot.click(type(icon_widget), offset=(0, 0))
-            await pilot.pause()
+            await pilot.click(icon_widget, offset=(0, 0))
 
             # Should have posted IconClicked
             assert len(app.icon_clicked_events) == 1
@@ -230,35 +226,52 @@ class TestFileLinkWithIconsClickability:
         async with app.run_test() as pilot:
             # Click the icon widget
             icon_widget = widget._icon_widgets["status"]
-            await pilot.click(type(icon_widget), offset=(0, 0))
-            await pilot.pause()
+            await pilot.click(icon_widget, offset=(0, 0))
 
             # Should not have posted IconClicked
             assert len(app.icon_clicked_events) == 0
 
-    async def test_multiple_clickable_icons(self, temp_file):
-        """Test multiple clickable icons work independently."""
+    async def test_clickable_icon_index_follows_rerender(self, temp_file):
+        """Test only the current clickable icon widgets are indexed for click dispatch."""
         icons = [
-            Icon(name="icon1", icon="1️⃣", clickable=True),
-            Icon(name="icon2", icon="2️⃣", clickable=True),
+            Icon(name="run", icon="▶️", clickable=True),
+            Icon(name="status", icon="✅", clickable=False),
         ]
         widget = FileLinkWithIcons(temp_file, icons_before=icons)
         app = FileLinkWithIconsTestApp(widget)
 
         async with app.run_test() as pilot:
-            # Simulate the click by posting the message directly
-            widget.post_message(FileLinkWithIcons.IconClicked(widget, temp_file, "icon1", "1️⃣"))
+            assert list(widget._clickable_icons) == [widget._icon_widgets["run"]]
+
+            widget.update_icon("status", clickable=True)
             await pilot.pause()
 
-            assert len(app.icon_clicked_events) == 1
-            assert app.icon_clicked_events[0].icon_name == "icon1"
+            assert set(widget._clickable_icons) == {widget._icon_widgets["run"], widget._icon_widgets["status"]}
 
-            # Click second icon
-            widget.post_message(FileLinkWithIcons.IconClicked(widget, temp_file, "icon2", "2️⃣"))
+            widget.set_icon_visible("run", False)
             await pilot.pause()
 
-            assert len(app.icon_clicked_events) == 2
-            assert app.icon_clicked_events[1].icon_name == "icon2"
+            assert list(widget._clickable_icons) == [widget._icon_widgets["status"]]
+
+            await pilot.click(widget._icon_widgets["status"])
+            assert app.icon_clicked_events[-1].icon_name == "status"
+
+    async def test_multiple_clickable_icons(self, temp_file):
+        """Test multiple clickable icons work independently."""
+        icons = [
+            Icon(name="icon1", icon="1️⃣", clickable=True),
+            Icon(name="icon2", icon="2️⃣", clickable=True),
+        ]
+        widget = FileLinkWithIcons(temp_file, icons_before=icons)
+        app = FileLinkWithIconsTestApp(widget)
+
+        async with app.run_test() as pilot:
+            # Click both icons back to back; one pause delivers both messages in order
+            await pilot.click(widget._icon_widgets["icon1"])
+            await pilot.click(widget._icon_widgets["icon2"])
+
+            assert [event.icon_name for event in app.icon_clicked_events] == ["icon1", "icon2"]
+            assert [event.icon_char for event in app.icon_clicked_events] == ["1️⃣", "2️⃣"]
 
 
 class TestFileLinkWithIconsKeyboardShortcuts:
@@ -336,7 +349,7 @@ class TestFileLinkWithIconsKeyboardShortcuts:
 class TestFileLinkWithIconsIconManagement:
     """Tests for icon management methods."""
 
-    async def test_get_icon_existing(self, temp_file):
+    def test_get_icon_existing(self, temp_file):
         """Test get_icon returns icon by name."""
         icons = [Icon(name="status", icon="✅")]
         widget = FileLinkWithIcons(temp_file, icons_before=icons)
@@ -346,13 +359,22 @@ class TestFileLinkWithIconsIconManagement:
         assert icon.name == "status"
         assert icon.icon == "✅"
 
-    async def test_get_icon_nonexistent(self, temp_file):
+    def test_get_icon_nonexistent(self, temp_file):
         """Test get_icon returns None for nonexistent icon."""
         widget = FileLinkWithIcons(temp_file)
 
         icon = widget.get_icon("nonexistent")
         assert icon is None
 
+    def test_get_icon_returns_configured_instances(self, temp_file):
+        """Test get_icon returns the Icon objects passed in, from both sides of the link."""
+        before = Icon(name="status", icon="✅")
+        after = Icon(name="lock", icon="🔒")
+        widget = FileLinkWithIcons(temp_file, icons_before=[before], icons_after=[after])
+
+        assert widget.get_icon("status") is before
+        assert widget.get_icon("lock") is after
+
     async def test_update_icon_content(self, temp_file):
         """Test update_icon changes icon character."""
         icons = [Icon(name="status", icon="⏳")]
@@ -383,6 +405,34 @@ class TestFileLinkWithIconsIconManagement:
             icon = widget.get_icon("status")
             assert icon.tooltip == "New tooltip"
 
+    async def test_update_icon_content_updates_widget_in_place(self, temp_file):
+        """Test update_icon reuses the mounted widget when only content changes."""
+        from unittest.mock import patch
+
+        icons = [Icon(name="status", icon="⏳", clickable=True, key="1")]
+        widget = FileLinkWithIcons(temp_file, icons_before=icons)
+        app = FileLinkWithIconsTestApp(widget)
+
+        async with app.run_test() as pilot:
+            icon_widget = widget._icon_widgets["status"]
+
+            widget.update_icon("status", icon="✅", tooltip="Passed")
+            await pilot.pause()
+
+            assert widget._icon_widgets["status"] is icon_widget
+            assert icon_widget.content == "✅"
+            assert icon_widget.tooltip == "Passed (1)"
+
+            # Same glyph again: tooltip still applies, but no re-render
+            with patch.object(icon_widget, "update") as mock_update:
+                widget.update_icon("status", icon="✅", tooltip="Still passing")
+                mock_update.assert_not_called()
+            assert icon_widget.tooltip == "Still passing (1)"
+
+            # Clicks report the new icon character
+            await pilot.click(icon_widget)
+            assert app.icon_clicked_events[-1].icon_char == "✅"
+
     async def test_update_icon_visibility(self, temp_file):
         """Test update_icon changes visibility."""
         icons = [Icon(name="status", icon="✅", visible=True)]
@@ -407,6 +457,8 @@ class TestFileLinkWithIconsIconManagement:
         app = FileLinkWithIconsTestApp(widget)
 
         async with app.run_test() as pilot:
+            assert widget._icon_widgets["status"].classes == {"icon-widget"}
+
             # Make clickable
             widget.update_icon("status", clickable=True)
             await pilot.pause()
@@ -414,6 +466,7 @@ class TestFileLinkWithIconsIconManagement:
             # Should be clickable
             icon = widget.get_icon("status")
             assert icon.clickable is True
+            assert widget._icon_widgets["status"].classes == {"icon-widget", "clickable"}
 
     async def test_update_icon_multiple_properties(self, temp_file):
         """Test update_icon changes multiple properties at once."""
@@ -437,14 +490,14 @@ class TestFileLinkWithIconsIconManagement:
             assert icon.tooltip == "Complete"
             assert icon.clickable is True
 
-    async def test_update_icon_nonexistent_raises(self, temp_file):
+    def test_update_icon_nonexistent_raises(self, temp_file):
         """Test update_icon raises ValueError for nonexistent icon."""
         widget = FileLinkWithIcons(temp_file)
 
         with pytest.raises(ValueError, match="not found"):
             widget.update_icon("nonexistent", icon="✅")
 
-    async def test_update_icon_invalid_property_raises(self, temp_file):
+    def test_update_icon_invalid_property_raises(self, temp_file):
         """Test update_icon raises ValueError for invalid property."""
         icons = [Icon(name="status", icon="✅")]
         widget = FileLinkWithIcons(temp_file, icons_before=icons)
@@ -456,7 +509,7 @@ class TestFileLinkWithIconsIconManagement:
 class TestFileLinkWithIconsValidation:
     """Tests for icon validation at initialization."""
 
-    async def test_duplicate_icon_names_raises(self, temp_file):
+    def test_duplicate_icon_names_raises(self, temp_file):
         """Test duplicate icon names raises ValueError."""
         icons = [
             Icon(name="duplicate", icon="✅"),
@@ -466,7 +519,7 @@ class TestFileLinkWithIconsValidation:
         with pytest.raises(ValueError, match="Duplicate icon names"):
             FileLinkWithIcons(temp_file, icons_before=icons)
 
-    async def test_duplicate_icon_keys_raises(self, temp_file):
+    def test_duplicate_icon_keys_raises(self, temp_file):
         """Test duplicate icon keys raises ValueError."""
         icons = [
             Icon(name="icon1", icon="✅", key="s"),
@@ -476,14 +529,14 @@ class TestFileLinkWithIconsValidation:
         with pytest.raises(ValueError, match="Duplicate icon keys"):
             FileLinkWithIcons(temp_file, icons_before=icons)
 
-    async def test_icon_key_conflicts_with_filelink_raises(self, temp_file):
+    def test_icon_key_conflicts_with_filelink_raises(self, temp_file):
         """Test icon key conflicting with FileLink binding raises ValueError."""
         icons = [Icon(name="icon1", icon="✅", key="o")]  # 'o' is FileLink's open key
 
         with pytest.raises(ValueError, match="conflicts with FileLink binding"):
             FileLinkWithIcons(temp_file, icons_before=icons)
 
-    async def test_duplicate_names_across_before_after_raises(self, temp_file):
+    def test_duplicate_names_across_before_after_raises(self, temp_file):
         """Test duplicate names across icons_before and icons_after raises."""
         icons_before = [Icon(name="duplicate", icon="✅")]
         icons_after = [Icon(name="duplicate", icon="❌")]
@@ -495,7 +548,7 @@ class TestFileLinkWithIconsValidation:
                 icons_after=icons_after,
             )
 
-    async def test_duplicate_keys_across_before_after_raises(self, temp_file):
+    def test_duplicate_keys_across_before_after_raises(self, temp_file):
         """Test duplicate keys across icons_before and icons_after raises."""
         icons_before = [Icon(name="icon1", icon="✅", key="1")]
         icons_after = [Icon(name="icon2", icon="❌", key="1")]
@@ -507,7 +560,7 @@ class TestFileLinkWithIconsValidation:
                 icons_after=icons_after,
             )
 
-    async def test_none_keys_allowed(self, temp_file):
+    def test_none_keys_allowed(self, temp_file):
         """Test that None keys don't count as duplicates."""
         icons = [
             Icon(name="icon1", icon="✅", key=None),
@@ -531,8 +584,7 @@ class TestFileLinkWithIconsMessageBubbling:
         async with app.run_test() as pilot:
             # Click icon
             icon_widget = widget._icon_widgets["settings"]
-            await pilot.click(type(icon_widget), offset=(0, 0))
-            await pilot.pause()
+            await pilot.click(icon_widget, offset=(0, 0))
 
             # App should have received the message
             assert len(app.icon_clicked_events) == 1
@@ -551,34 +603,28 @@ class TestFileLinkWithIconsMessageBubbling:
             assert len(app.file_opened_events) == 1
             assert app.file_opened_events[0].path == temp_file
 
-    async def test_filelink_with_icons_auto_generates_id(self, temp_file):
+    def test_filelink_with_icons_auto_generates_id(self, temp_file):
         """Test FileLinkWithIcons auto-generates ID from filename."""
         widget = FileLinkWithIcons(temp_file)
-        app = FileLinkWithIconsTestApp(widget)
 
-        async with app.run_test():
-            # temp_file is "test.txt" -> id="test-txt"
-            assert widget.id is not None
-            assert widget.id == sanitize_id(temp_file.name)
-            assert widget.id == "test-txt"
+        # temp_file is "test.txt" -> id="test-txt"
+        assert widget.id is not None
+        assert widget.id == sanitize_id(temp_file.name)
+        assert widget.id == "test-txt"
 
-    async def test_filelink_with_icons_explicit_id_overrides_auto(self, temp_file):
+    def test_filelink_with_icons_explicit_id_overrides_auto(self, temp_file):
         """Test explicit ID takes precedence over auto-generation."""
         widget = FileLinkWithIcons(temp_file, id="custom-id")
-        app = FileLinkWithIconsTestApp(widget)
 
-        async with app.run_test():
-            assert widget.id == "custom-id"
+        assert widget.id == "custom-id"
 
-    async def test_filelink_with_icons_custom_open_keys(self, temp_file):
+    def test_filelink_with_icons_custom_open_keys(self, temp_file):
         """Test FileLinkWithIcons accepts custom open_keys parameter."""
         widget = FileLinkWithIcons(temp_file, open_keys=["f2", "ctrl+o"])
-        app = FileLinkWithIconsTestApp(widget)
 
-        async with app.run_test():
-            # Verify custom keys were forwarded to embedded FileLink
-            assert widget._custom_open_keys == ["f2", "ctrl+o"]
-            assert widget.file_link._custom_open_keys == ["f2", "ctrl+o"]
+        # Verify custom keys were forwarded to embedded FileLink
+        assert widget._custom_open_keys == ["f2", "ctrl+o"]
+        assert widget.file_link._custom_open_keys == ["f2", "ctrl+o"]
 
     async def test_filelink_with_icons_open_keys_in_tooltip(self, temp_file):
         """Test custom open_keys are reflected in tooltip."""
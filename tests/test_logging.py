@@ -9,6 +9,14 @@ from textual_filelink.icon import Icon
 from textual_filelink.logging import disable_logging, get_logger, setup_logging
 
 
+@pytest.fixture(autouse=True)
+def restore_logger_level():
+    """Restore the package logger's level so DEBUG never leaks into later test modules."""
+    level = get_logger().level
+    yield
+    get_logger().setLevel(level)
+
+
 class TestLoggingSetup:
     """Test logging configuration."""
 
@@ -1,7 +1,6 @@
 # Tests for tooltip enhancement with keyboard shortcuts
 
 
-import pytest
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 
@@ -30,14 +29,6 @@ class CommandLinkTestApp(App):
         yield self.widget
 
 
-@pytest.fixture
-def temp_file(tmp_path):
-    """Create a temporary file for testing."""
-    test_file = tmp_path / "test.txt"
-    test_file.write_text("test content")
-    return test_file
-
-
 # ============================================================================
 # FileLink Tooltip Enhancement Tests
 # ============================================================================
@@ -220,8 +211,9 @@ async def test_tooltip_format_consistency(temp_file):
         # FileLink should have tooltip with parentheses format
         assert "(" in link1.tooltip and ")" in link1.tooltip
 
+    app = CommandLinkTestApp(link2)
+    async with app.run_test():
         # CommandLink tooltips are on child widgets
-        assert link2 is not None
         assert "(" in link2._play_stop_widget.tooltip and ")" in link2._play_stop_widget.tooltip
 
 
@@ -1,78 +1,142 @@
 """Tests for utility functions."""
 
+import os
+from pathlib import Path
+
 import pytest
 
-from textual_filelink.utils import command_from_template, format_duration, format_time_ago, sanitize_id
+from textual_filelink.utils import (
+    absolute_path,
+    command_from_template,
+    format_duration,
+    format_time_ago,
+    relative_to_cwd,
+    sanitize_id,
+)
 
 
 class TestSanitizeId:
     """Tests for sanitize_id() function."""
 
-    def test_sanitize_basic_string(self):
-        """Test basic string sanitization."""
-        assert sanitize_id("Run Tests") == "run-tests"
-        assert sanitize_id("Build Project") == "build-project"
-
-    def test_sanitize_path_forward_slash(self):
-        """Test path sanitization with forward slashes."""
-        assert sanitize_id("src/main.py") == "src-main-py"
-        assert sanitize_id("tests/unit/test_file.py") == "tests-unit-test_file-py"
-
-    def test_sanitize_path_backslash(self):
-        """Test path sanitization with backslashes (Windows)."""
-        assert sanitize_id("src\\file.py") == "src-file-py"
-        assert sanitize_id("C:\\Users\\name\\file.txt") == "c--users-name-file-txt"
-
-    def test_sanitize_special_characters(self):
-        """Test sanitization of special characters."""
-        assert sanitize_id("Build!") == "build-"
-        assert sanitize_id("Test@Project#123") == "test-project-123"
-        assert sanitize_id("File (copy).txt") == "file--copy--txt"
-
-    def test_sanitize_already_clean(self):
-        """Test sanitization of already-clean IDs."""
-        assert sanitize_id("clean-id") == "clean-id"
-        assert sanitize_id("my_widget_123") == "my_widget_123"
-        assert sanitize_id("simple") == "simple"
-
-    def test_sanitize_unicode_emoji(self):
-        """Test sanitization of unicode and emoji characters."""
-        assert sanitize_id("test🔥file") == "test-file"
-        assert sanitize_id("my_✅_test") == "my_-_test"
-
-    def test_sanitize_multiple_spaces(self):
-        """Test sanitization of multiple consecutive spaces."""
-        assert sanitize_id("test  file") == "test--file"
-        assert sanitize_id("   spaces   ") == "---spaces---"
-
-    def test_sanitize_mixed_separators(self):
-        """Test sanitization with mixed separators."""
-        assert sanitize_id("path/to\\file name.txt") == "path-to-file-name-txt"
-
-    def test_sanitize_preserves_underscores(self):
-        """Test that underscores are preserved."""
-        assert sanitize_id("my_test_file") == "my_test_file"
-        assert sanitize_id("TEST_CONSTANT") == "test_constant"
-
-    def test_sanitize_preserves_hyphens(self):
-        """Test that hyphens are preserved."""
-        assert sanitize_id("my-test-file") == "my-test-file"
-        assert sanitize_id("dash-separated-words") == "dash-separated-words"
-
-    def test_sanitize_numbers(self):
-        """Test sanitization with numbers."""
-        assert sanitize_id("test123") == "test123"
-        assert sanitize_id("123test") == "123test"
-        assert sanitize_id("v1.2.3") == "v1-2-3"
-
-    def test_sanitize_empty_string(self):
-        """Test sanitization of empty string."""
-        assert sanitize_id("") == ""
-
-    def test_sanitize_only_special_chars(self):
-        """Test sanitization of string with only special characters."""
-        assert sanitize_id("!!!") == "---"
-        assert sanitize_id("@#$") == "---"
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            # Basic strings
+            ("Run Tests", "run-tests"),
+            ("Build Project", "build-project"),
+            # Paths with forward slashes
+            ("src/main.py", "src-main-py"),
+            ("tests/unit/test_file.py", "tests-unit-test_file-py"),
+            # Paths with backslashes (Windows)
+            ("src\\file.py", "src-file-py"),
+            ("C:\\Users\\name\\file.txt", "c--users-name-file-txt"),
+            # Mixed separators
+            ("path/to\\file name.txt", "path-to-file-name-txt"),
+            # Special characters
+            ("Build!", "build-"),
+            ("Test@Project#123", "test-project-123"),
+            ("File (copy).txt", "file--copy--txt"),
+            # Already clean
+            ("clean-id", "clean-id"),
+            ("my_widget_123", "my_widget_123"),
+            ("simple", "simple"),
+            # Emoji and symbols are replaced
+            ("test🔥file", "test-file"),
+            ("my_✅_test", "my_-_test"),
+            # Consecutive spaces each become a hyphen
+            ("test  file", "test--file"),
+            ("   spaces   ", "---spaces---"),
+            # Underscores and hyphens are preserved
+            ("my_test_file", "my_test_file"),
+            ("TEST_CONSTANT", "test_constant"),
+            ("my-test-file", "my-test-file"),
+            ("dash-separated-words", "dash-separated-words"),
+            # Numbers
+            ("test123", "test123"),
+            ("123test", "123test"),
+            ("v1.2.3", "v1-2-3"),
+            # Non-ASCII letters and digits are kept, like str.isalnum()
+            ("Café Menü", "café-menü"),
+            ("файл.py", "файл-py"),
+            # Edge cases
+            ("", ""),
+            ("!!!", "---"),
+            ("@#$", "---"),
+        ],
+    )
+    def test_sanitize_id(self, name, expected):
+        """Test names are lowercased and every character outside [\\w-] becomes a hyphen."""
+        assert sanitize_id(name) == expected
+
+    def test_sanitize_results_are_cached(self):
+        """Test that repeated names are served from the cache."""
+        sanitize_id.cache_clear()
+        assert sanitize_id("Cached Name") == "cached-name"
+        assert sanitize_id("Cached Name") == "cached-name"
+        info = sanitize_id.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+
+
+class TestAbsolutePath:
+    """Tests for absolute_path() function."""
+
+    def test_relative_string_made_absolute(self, tmp_path, monkeypatch):
+        """Test relative string paths are joined to the working directory."""
+        monkeypatch.chdir(tmp_path)
+        assert absolute_path("src/main.py") == Path.cwd() / "src" / "main.py"
+
+    def test_absolute_path_returned_as_is(self, tmp_path):
+        """Test an absolute, normalized Path is returned without a copy."""
+        path = tmp_path / "file.py"
+        assert absolute_path(path) is path
+
+    def test_parent_segments_normalized(self, tmp_path):
+        """Test '..' segments are collapsed."""
+        assert absolute_path(tmp_path / "sub" / ".." / "file.py") == tmp_path / "file.py"
+
+    def test_symlinks_not_followed(self, tmp_path):
+        """Test symlinks are kept rather than resolved to their target."""
+        target = tmp_path / "target.txt"
+        target.write_text("x")
+        link = tmp_path / "link.txt"
+        link.symlink_to(target)
+        assert absolute_path(str(link)) == link
+
+
+class TestRelativeToCwd:
+    """Tests for relative_to_cwd() function."""
+
+    def test_path_inside_cwd(self, tmp_path, monkeypatch):
+        """Test a path inside the working directory is made relative."""
+        monkeypatch.chdir(tmp_path)
+        assert relative_to_cwd(Path.cwd() / "src" / "main.py") == Path("src") / "main.py"
+
+    def test_cwd_itself(self, tmp_path, monkeypatch):
+        """Test the working directory itself is relative '.'."""
+        monkeypatch.chdir(tmp_path)
+        assert relative_to_cwd(Path.cwd()) == Path(".")
+
+    def test_case_insensitive_match_where_normcase_folds_case(self, tmp_path, monkeypatch):
+        """Test a path differing from cwd only in case is relative where the OS ignores case (Windows)."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(os.path, "normcase", str.lower)
+        upper_path = Path(str(Path.cwd()).upper()) / "src" / "main.py"
+
+        assert relative_to_cwd(upper_path) == Path("src") / "main.py"
+
+    def test_path_outside_cwd(self, tmp_path, monkeypatch):
+        """Test paths outside the working directory return None."""
+        (tmp_path / "sub").mkdir()
+        monkeypatch.chdir(tmp_path / "sub")
+        assert relative_to_cwd(tmp_path / "other.py") is None
+        assert relative_to_cwd(tmp_path) is None
+
+    def test_sibling_with_common_prefix(self, tmp_path, monkeypatch):
+        """Test a sibling directory sharing a name prefix is not treated as inside."""
+        (tmp_path / "proj").mkdir()
+        monkeypatch.chdir(tmp_path / "proj")
+        assert relative_to_cwd(tmp_path / "proj-old" / "file.py") is None
 
 
 class TestFormatDuration:
@@ -269,6 +333,15 @@ class TestCommandFromTemplate:
         with pytest.raises(ValueError, match="Unknown template variables"):
             command_from_template("editor {{ pth }} {{ line }}")  # typo: pth instead of path
 
+    def test_builder_cached_per_template(self):
+        """Test the same template returns the same builder, and invalid ones keep raising."""
+        assert command_from_template("vim {{ path }}") is command_from_template("vim {{ path }}")
+        assert command_from_template("vim {{ path }}") is not command_from_template("nano {{ path }}")
+
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Unknown template variables"):
+                command_from_template("editor {{ unknown }}")
+
     def test_whitespace_variations(self, tmp_path):
         """Test that {{ var }} and {{var}} both work."""
         test_file = tmp_path / "test.py"